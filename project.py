@@ -1,6 +1,14 @@
+import os
 import sys
+import json
+import time
+import hashlib
 import inspect
 import subprocess
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import wait
 from subprocess import CompletedProcess
 import shutil
 import logging
@@ -10,6 +18,7 @@ from logging.config import dictConfig as logging_config_dict
 from argparse import ArgumentParser
 from argparse import Namespace
 from pathlib import Path
+from xml.etree import ElementTree
 from pip._vendor import tomli
 
 class Project:
@@ -19,8 +28,54 @@ class Project:
     __logger: None | LoggerAdapter = None
     __help_message: None | str = None
     __subprocess_timeout: None | int = None
+    __bench_threshold: None | float = None
+    __bench_budget: None | float = None
+    __bench_update_baseline: bool = False
+    __jobs: None | int = None
+    __force: bool = False
+    __test_workers: int = 1
     __commands: None | list[str] = None
     __project_dir: str = Path(__file__).parent.absolute().as_posix()
+    # task: dependencies, inputs and outputs relative to the project dir, clean command run before a stale output is rebuilt
+    __tasks: dict[str, dict[str, object]] = {
+        'wheelhouse': {
+            'dependencies': [],
+            'inputs': ['pyproject.toml'],
+            'outputs': ['build/wheelhouse'],
+            'clean': 'clean_wheelhouse'
+        },
+        'env': {
+            'dependencies': ['wheelhouse'],
+            'inputs': ['pyproject.toml'],
+            'outputs': ['build/env'],
+            'clean': 'clean_env'
+        },
+        'test_env': {
+            'dependencies': ['env'],
+            'inputs': ['pyproject.toml'],
+            'outputs': ['build/test/env'],
+            'clean': 'clean_test_env'
+        },
+        'package': {
+            'dependencies': ['env'],
+            'inputs': ['pyproject.toml', 'src/main/py'],
+            'outputs': ['build/dist'],
+            'clean': 'clean_package'
+        },
+        'update_test_env': {
+            'dependencies': ['package', 'test_env'],
+            'inputs': [],
+            'outputs': ['build/test/env'],
+            'clean': None
+        },
+        'test': {
+            # pytest runs in build/test/env, it never runs while 'update_test_env' installs into it
+            'dependencies': ['update_test_env'],
+            'inputs': ['pyproject.toml', 'src/main/py', 'src/test/py'],
+            'outputs': ['build/test/out/report/xml/report.xml'],
+            'clean': None
+        }
+    }
 
     def __init__(
         self,
@@ -38,6 +93,12 @@ class Project:
 
             if namespace is not None:
                 self.__subprocess_timeout = namespace.subprocess_timeout if namespace.subprocess_timeout > 0 else None
+                self.__bench_threshold = namespace.bench_threshold
+                self.__bench_budget = namespace.bench_budget
+                self.__bench_update_baseline = namespace.bench_update_baseline
+                self.__jobs = namespace.jobs if namespace.jobs and namespace.jobs > 0 else None
+                self.__force = namespace.force
+                self.__test_workers = namespace.test_workers if namespace.test_workers and namespace.test_workers > 0 else (os.cpu_count() or 1)
                 self.__commands = [namespace.commands] if isinstance(namespace.commands, str) else namespace.commands
         except Exception as e:
             if self.__logger: self.__logger.error(e, exc_info=True)
@@ -50,16 +111,85 @@ class Project:
             self.__logger.error(e, exc_info=True)
             raise e
 
+    def wheelhouse(self) -> None:
+        try:
+            project_dir: str = Path(self.__project_dir).as_posix()
+            build_dir: str = Path(project_dir).joinpath('build').as_posix()
+            wheelhouse_dir: str = Path(build_dir).joinpath('wheelhouse').as_posix()
+
+            if Path(wheelhouse_dir).exists():
+                return None
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
+            start: float = time.perf_counter()
+
+            # download and build every wheel once, 'env' and 'test_env' install from here without an index
+            requirements: list[str] = self._get_requirements(test=True)
+            Path(wheelhouse_dir).mkdir(parents=True, exist_ok=True)
+            requirements_file: str = Path(wheelhouse_dir).joinpath('requirements.txt').as_posix()
+            Path(requirements_file).write_bytes('\n'.join(requirements).encode())
+            if requirements:
+                cmd: list[str] = [
+                    sys.executable,
+                    '-m', 'pip', 'wheel',
+                    '-w', wheelhouse_dir,
+                    '--trusted-host', 'pypi.org',
+                    '--trusted-host', 'pypi.python.org',
+                    '--trusted-host', 'files.pythonhosted.org',
+                    '-r', requirements_file
+                ]
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+                try:
+                    subprocess.run(
+                        cmd,
+                        cwd=project_dir,
+                        text=True,
+                        check=True,
+                        capture_output=False,
+                        timeout=self.__subprocess_timeout
+                    )
+                except Exception:
+                    # a partial wheelhouse is not reused
+                    shutil.rmtree(wheelhouse_dir)
+                    raise
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            self.__logger.error(e, exc_info=True)
+            raise e
+
+    def clean_wheelhouse(self) -> None:
+        try:
+            project_dir: str = Path(self.__project_dir).as_posix()
+            build_dir: str = Path(project_dir).joinpath('build').as_posix()
+            wheelhouse_dir: str = Path(build_dir).joinpath('wheelhouse').as_posix()
+
+            if not Path(wheelhouse_dir).exists():
+                return None
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
+
+            shutil.rmtree(wheelhouse_dir)
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+        except Exception as e:
+            self.__logger.error(e, exc_info=True)
+            raise e
+
     def env(self) -> None:
         try:
             project_dir: str = Path(self.__project_dir).as_posix()
             build_dir: str = Path(project_dir).joinpath('build').as_posix()
             env_dir: str = Path(build_dir).joinpath('env').as_posix()
+            wheelhouse_dir: str = Path(build_dir).joinpath('wheelhouse').as_posix()
 
             if Path(env_dir).exists():
                 return None
+            if not Path(wheelhouse_dir).exists():
+                raise Exception(f"not exists '{wheelhouse_dir}'")
 
             self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
+            start: float = time.perf_counter()
 
             # create env
             cmd: list[str] = [
@@ -76,35 +206,16 @@ class Project:
                 capture_output=False,
                 timeout=self.__subprocess_timeout
             )
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] venv: {time.perf_counter() - start:.1f}s")
 
             # install dependencies
-            project_toml: dict[str, object] = tomli.loads(Path(project_dir).joinpath('pyproject.toml').read_bytes().decode())
-            requirements: list[str] = project_toml.get('project', dict()).get('dependencies', list())
-            if not requirements:
-                return None
-            requirements_content: str = '\n'.join(requirements)
-            requirements_file: str = Path(env_dir).joinpath('requirements.txt').as_posix()
-            Path(requirements_file).write_bytes(requirements_content.encode())
-            python_file: str = self._find_python(dir=env_dir)
-            cmd = [
-                python_file,
-                '-m', 'pip', 'install',
-                '--trusted-host', 'pypi.org',
-                '--trusted-host', 'pypi.python.org',
-                '--trusted-host', 'files.pythonhosted.org',
-                '-r', requirements_file
-            ]
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
-            subprocess.run(
-                cmd,
-                cwd=project_dir,
-                text=True,
-                check=True,
-                capture_output=False,
-                timeout=self.__subprocess_timeout
-            )
+            requirements: list[str] = self._get_requirements(test=False)
+            if requirements:
+                installed: float = time.perf_counter()
+                self._install(env_dir=env_dir, requirements=requirements)
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] install: {time.perf_counter() - installed:.1f}s")
 
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done in {time.perf_counter() - start:.1f}s")
         except Exception as e:
             self.__logger.error(e, exc_info=True)
             raise e
@@ -188,59 +299,54 @@ class Project:
         try:
             project_dir: str = Path(self.__project_dir).as_posix()
             build_dir: str = Path(project_dir).joinpath('build').as_posix()
+            base_env_dir: str = Path(build_dir).joinpath('env').as_posix()
             test_dir: str = Path(build_dir).joinpath('test').as_posix()
             env_dir: str = Path(test_dir).joinpath('env').as_posix()
 
             if Path(env_dir).exists():
                 return None
+            if not Path(base_env_dir).exists():
+                raise Exception(f"not exists '{base_env_dir}'")
 
             self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
-
-            # create env
-            cmd: list[str] = [
-                sys.executable,
-                '-m', 'venv',
-                env_dir
-            ]
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
-            subprocess.run(
-                cmd,
-                cwd=project_dir,
-                text=True,
-                check=True,
-                capture_output=False,
-                timeout=self.__subprocess_timeout
-            )
-
-            # install dependencies
-            project_toml: dict[str, object] = tomli.loads(Path(project_dir).joinpath('pyproject.toml').read_bytes().decode())
-            requirements: list[str] = project_toml.get('project', dict()).get('dependencies', list())
-            requirements.extend(project_toml.get('project', dict()).get('optional-dependencies', dict()).get('test', list()))
-            if not requirements:
-                return None
-            requirements_content: str = '\n'.join(requirements)
-            requirements_file: str = Path(env_dir).joinpath('requirements.txt').as_posix()
-            Path(requirements_file).write_bytes(requirements_content.encode())
-            python_file: str = self._find_python(dir=env_dir)
-            cmd = [
-                python_file,
-                '-m', 'pip', 'install',
-                '--trusted-host', 'pypi.org',
-                '--trusted-host', 'pypi.python.org',
-                '--trusted-host', 'files.pythonhosted.org',
-                '-r', requirements_file
-            ]
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
-            subprocess.run(
-                cmd,
-                cwd=project_dir,
-                text=True,
-                check=True,
-                capture_output=False,
-                timeout=self.__subprocess_timeout
-            )
-
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+            start: float = time.perf_counter()
+
+            if os.name == 'nt':
+                # windows launchers embed the env path in their binary and can not be rewritten, the env is created
+                cmd: list[str] = [
+                    sys.executable,
+                    '-m', 'venv',
+                    env_dir
+                ]
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+                subprocess.run(
+                    cmd,
+                    cwd=project_dir,
+                    text=True,
+                    check=True,
+                    capture_output=False,
+                    timeout=self.__subprocess_timeout
+                )
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] venv: {time.perf_counter() - start:.1f}s")
+            else:
+                # derive from env, pip and the project dependencies are copied instead of installed again
+                shutil.copytree(base_env_dir, env_dir, symlinks=True)
+                for file in Path(env_dir).joinpath('bin').iterdir():
+                    if file.is_symlink() or not file.is_file():
+                        continue
+                    content: bytes = file.read_bytes()
+                    if Path(base_env_dir).as_posix().encode() in content:
+                        file.write_bytes(content.replace(Path(base_env_dir).as_posix().encode(), Path(env_dir).as_posix().encode()))
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] copy: {time.perf_counter() - start:.1f}s")
+
+            # install test dependencies
+            requirements: list[str] = self._get_requirements(test=True)
+            if requirements:
+                installed: float = time.perf_counter()
+                self._install(env_dir=env_dir, requirements=requirements)
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] install: {time.perf_counter() - installed:.1f}s")
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done in {time.perf_counter() - start:.1f}s")
         except Exception as e:
             self.__logger.error(e, exc_info=True)
             raise e
@@ -260,7 +366,7 @@ class Project:
 
             # install dependencies
             python_file: str = self._find_python(dir=env_dir)
-            package_files: list[str] = [v.as_posix() for v, _, _ in Path(dist_dir).rglob('*.whl')]
+            package_files: list[str] = [v.as_posix() for v in Path(dist_dir).rglob('*.whl')]
             cmd = [
                 python_file,
                 '-m', 'pip', 'install',
@@ -318,6 +424,10 @@ class Project:
 
             # test
             python_file: str = self._find_python(dir=env_dir)
+            if self.__test_workers > 1:
+                self._test_shards(python_file=python_file)
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+                return None
             cmd = [
                 python_file,
                 '-m', 'pytest'
@@ -356,10 +466,90 @@ class Project:
             self.__logger.error(e, exc_info=True)
             raise e
 
+    def bench(self) -> None:
+        try:
+            project_dir: str = Path(self.__project_dir).as_posix()
+            build_dir: str = Path(project_dir).joinpath('build').as_posix()
+            test_dir: str = Path(build_dir).joinpath('test').as_posix()
+            env_dir: str = Path(test_dir).joinpath('env').as_posix()
+            bench_dir: str = Path(build_dir).joinpath('bench').as_posix()
+            bench_file: str = Path(project_dir).joinpath('src', 'test', 'py', 'bench', 'bench_xml_to_dict.py').as_posix()
+            bench_import_file: str = Path(project_dir).joinpath('src', 'test', 'py', 'bench', 'bench_import.py').as_posix()
+
+            if not Path(env_dir).exists():
+                raise Exception(f"not exists '{env_dir}'")
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
+
+            # bench, fails when throughput drops below the baseline or the baseline is missing,
+            # '--bench-update-baseline' writes it, it is kept outside 'build/bench' so 'clean' does not reset the comparison
+            python_file: str = self._find_python(dir=env_dir)
+            cmd = [
+                python_file,
+                bench_file,
+                '--out', Path(bench_dir).joinpath('xml_to_dict', 'results.json').as_posix(),
+                '--baseline', Path(build_dir).joinpath('baseline', 'bench', 'xml_to_dict.json').as_posix()
+            ]
+            if self.__bench_threshold is not None:
+                cmd.extend(['--threshold', str(self.__bench_threshold)])
+            if self.__bench_update_baseline:
+                cmd.append('--update-baseline')
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+            subprocess.run(
+                cmd,
+                cwd=project_dir,
+                text=True,
+                check=True,
+                capture_output=False,
+                timeout=self.__subprocess_timeout
+            )
+
+            # import time, fails when a cold start with a small document goes over the budget
+            cmd = [
+                python_file,
+                bench_import_file,
+                '--out', Path(bench_dir).joinpath('import', 'results.json').as_posix()
+            ]
+            if self.__bench_budget is not None:
+                cmd.extend(['--budget-ms', str(self.__bench_budget)])
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+            subprocess.run(
+                cmd,
+                cwd=project_dir,
+                text=True,
+                check=True,
+                capture_output=False,
+                timeout=self.__subprocess_timeout
+            )
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+        except Exception as e:
+            self.__logger.error(e, exc_info=True)
+            raise e
+
+    def clean_bench(self) -> None:
+        try:
+            project_dir: str = Path(self.__project_dir).as_posix()
+            build_dir: str = Path(project_dir).joinpath('build').as_posix()
+            bench_dir: str = Path(build_dir).joinpath('bench').as_posix()
+
+            if not Path(bench_dir).exists():
+                return None
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
+
+            shutil.rmtree(bench_dir)
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done")
+        except Exception as e:
+            self.__logger.error(e, exc_info=True)
+            raise e
+
     def clean(self) -> None:
         try:
             self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ...")
 
+            self.clean_bench()
             self.clean_test()
             self.clean_test_env()
             self.clean_package()
@@ -372,8 +562,7 @@ class Project:
 
     def vscode(self) -> None:
         try:
-            self.env()
-            self.test_env()
+            self._run_tasks(['env', 'test_env'])
 
             project_dir: str = Path(self.__project_dir).as_posix()
             build_dir: str = Path(project_dir).joinpath('build').as_posix()
@@ -389,27 +578,10 @@ class Project:
             launch_json = launch_json.replace('@_PYTHON@', Path(python_file).relative_to(project_dir).as_posix())
 
             # list tests
-            cmd = [
-                python_file,
-                '-m', 'pytest', '-q', '--co'
-            ]
-            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
-            list_tests_out: CompletedProcess[str] = subprocess.run(
-                cmd,
-                cwd=project_dir,
-                text=True,
-                check=True,
-                capture_output=True,
-                timeout=self.__subprocess_timeout
-            )
             test_entries: list[str] = [
                 "src/test/py"
             ]
-            for v in list_tests_out.stdout.splitlines():
-                line: str = str(v).strip()
-                if not line:
-                    break
-                test_entries.append(line)
+            test_entries.extend(self._list_tests(python_file=python_file))
             if not test_entries:
                 raise Exception(f"no tests found")
             launch_json = launch_json.replace('@_OPTIONS@', '",\n                "'.join(test_entries))
@@ -425,16 +597,296 @@ class Project:
 
     def _run(self) -> int:
         try:
+            # consecutive task commands run as one graph, other commands run in order between them
+            tasks: list[str] = []
             for command in self.__commands:
+                if command in self.__tasks:
+                    tasks.append(command)
+                    continue
+                if tasks:
+                    self._run_tasks(tasks)
+                    tasks = []
                 method = getattr(self, command)
                 if not method:
                     raise Exception(f"command not found: '{command}'")
                 method()
+            if tasks:
+                self._run_tasks(tasks)
             return 0
         except Exception as e:
             self.__logger.error(e, exc_info=True)
             raise e
 
+    def _run_tasks(self, names: list[str]) -> None:
+        try:
+            # requested tasks and everything they depend on, in dependency order
+            order: list[str] = []
+            pending: list[str] = list(reversed(names))
+            while pending:
+                name: str = pending[-1]
+                missing: list[str] = [v for v in self.__tasks[name]['dependencies'] if v not in order]
+                if missing:
+                    pending.extend(reversed(missing))
+                    continue
+                pending.pop()
+                if name not in order:
+                    order.append(name)
+
+            fingerprints: dict[str, str] = {}
+            for name in order:
+                fingerprints[name] = self._fingerprint(name, [fingerprints[v] for v in self.__tasks[name]['dependencies']])
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... {order}")
+            start: float = time.perf_counter()
+            done: dict[str, bool] = {}
+            running: dict[Future, str] = {}
+            with ThreadPoolExecutor(max_workers=self.__jobs or len(order), thread_name_prefix='task') as executor:
+                while len(done) < len(order):
+                    for name in order:
+                        if name in done or name in running.values():
+                            continue
+                        dependencies: list[str] = self.__tasks[name]['dependencies']
+                        if not all(v in done for v in dependencies):
+                            continue
+                        # tasks that write the same output never run at the same time
+                        if any(set(self.__tasks[name]['outputs']) & set(self.__tasks[v]['outputs']) for v in running.values()):
+                            continue
+                        # a task whose dependency ran is never up to date, its output was built against the old one
+                        if not any(done[v] for v in dependencies) and self._is_up_to_date(name, fingerprints[name]):
+                            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] up to date: '{name}'")
+                            done[name] = False
+                            continue
+                        running[executor.submit(self._run_task, name, fingerprints[name])] = name
+                    if not running:
+                        continue
+                    finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        name: str = running.pop(future)
+                        try:
+                            future.result()
+                        except Exception:
+                            # tasks already started are finished, nothing new is scheduled
+                            wait(running)
+                            raise
+                        done[name] = True
+
+            self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] ... done in {time.perf_counter() - start:.1f}s ran: {[v for v in order if done[v]]}")
+        except Exception as e:
+            self.__logger.error(e, exc_info=True)
+            raise e
+
+    def _run_task(self, name: str, fingerprint: str) -> None:
+        start: float = time.perf_counter()
+        stamp_file: Path = self._get_stamp_file(name)
+        stamp_file.unlink(missing_ok=True)
+        clean: None | str = self.__tasks[name]['clean']
+        if clean is not None:
+            getattr(self, clean)()
+        getattr(self, name)()
+        stamp_file.parent.mkdir(parents=True, exist_ok=True)
+        stamp_file.write_bytes(json.dumps({'fingerprint': fingerprint}).encode())
+        self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] '{name}' done in {time.perf_counter() - start:.1f}s")
+
+    def _is_up_to_date(self, name: str, fingerprint: str) -> bool:
+        if self.__force:
+            return False
+        for output in self.__tasks[name]['outputs']:
+            if not Path(self.__project_dir).joinpath(output).exists():
+                return False
+        stamp_file: Path = self._get_stamp_file(name)
+        if not stamp_file.exists():
+            return False
+        return json.loads(stamp_file.read_bytes().decode()).get('fingerprint') == fingerprint
+
+    def _fingerprint(self, name: str, dependencies: list[str]) -> str:
+        digest = hashlib.sha256()
+        digest.update(f"{name}\n{sys.version}\n{sys.executable}\n".encode())
+        for fingerprint in dependencies:
+            digest.update(f"{fingerprint}\n".encode())
+        for value in self.__tasks[name]['inputs']:
+            path: Path = Path(self.__project_dir).joinpath(value)
+            files: list[Path] = sorted(v for v in path.rglob('*') if v.is_file()) if path.is_dir() else [path]
+            for file in files:
+                if '__pycache__' in file.parts or not file.exists():
+                    continue
+                digest.update(f"{file.relative_to(self.__project_dir).as_posix()}\n".encode())
+                digest.update(hashlib.sha256(file.read_bytes()).digest())
+        return digest.hexdigest()
+
+    def _get_stamp_file(self, name: str) -> Path:
+        return Path(self.__project_dir).joinpath('build', 'tasks', f"{name}.json")
+
+    def _get_requirements(self, test: bool) -> list[str]:
+        project_dir: str = Path(self.__project_dir).as_posix()
+        project_toml: dict[str, object] = tomli.loads(Path(project_dir).joinpath('pyproject.toml').read_bytes().decode())
+        requirements: list[str] = list(project_toml.get('project', dict()).get('dependencies', list()))
+        if test:
+            requirements.extend(project_toml.get('project', dict()).get('optional-dependencies', dict()).get('test', list()))
+        return requirements
+
+    def _install(self, env_dir: str, requirements: list[str]) -> None:
+        project_dir: str = Path(self.__project_dir).as_posix()
+        wheelhouse_dir: str = Path(project_dir).joinpath('build', 'wheelhouse').as_posix()
+        requirements_file: str = Path(env_dir).joinpath('requirements.txt').as_posix()
+        Path(requirements_file).write_bytes('\n'.join(requirements).encode())
+        python_file: str = self._find_python(dir=env_dir)
+        cmd: list[str] = [
+            python_file,
+            '-m', 'pip', 'install',
+            '--no-index',
+            '--find-links', wheelhouse_dir,
+            '-r', requirements_file
+        ]
+        self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+        subprocess.run(
+            cmd,
+            cwd=project_dir,
+            text=True,
+            check=True,
+            capture_output=False,
+            timeout=self.__subprocess_timeout
+        )
+
+    def _list_tests(self, python_file: str) -> list[str]:
+        cmd: list[str] = [
+            python_file,
+            '-m', 'pytest', '-q', '--co'
+        ]
+        self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] execute: {cmd}")
+        list_tests_out: CompletedProcess[str] = subprocess.run(
+            cmd,
+            cwd=self.__project_dir,
+            text=True,
+            check=True,
+            capture_output=True,
+            timeout=self.__subprocess_timeout
+        )
+        tests: list[str] = []
+        for v in list_tests_out.stdout.splitlines():
+            line: str = str(v).strip()
+            if not line:
+                break
+            tests.append(line)
+        return tests
+
+    def _test_shards(self, python_file: str) -> None:
+        start: float = time.perf_counter()
+        out_dir: Path = Path(self.__project_dir).joinpath('build', 'test', 'out')
+        report_file: Path = out_dir.joinpath('report', 'xml', 'report.xml')
+        shards_dir: Path = out_dir.joinpath('shards')
+
+        # durations come from the previous merged report, read before 'pytest --co' rewrites it empty
+        durations: dict[tuple[str, str], float] = dict()
+        if report_file.exists():
+            for testcase in ElementTree.parse(report_file).getroot().iter('testcase'):
+                durations[(testcase.get('classname', ''), testcase.get('name', ''))] = float(testcase.get('time', 0))
+
+        tests: list[str] = self._list_tests(python_file=python_file)
+        if not tests:
+            raise Exception(f"no tests found")
+        keys: list[tuple[str, str]] = [self._get_test_key(v) for v in tests]
+        # tests without a recorded duration get the average
+        known: list[float] = [durations[v] for v in keys if v in durations]
+        default: float = sum(known) / len(known) if known else 1.0
+
+        # longest first onto the least loaded shard, each shard keeps the collection order
+        workers: int = min(self.__test_workers, len(tests))
+        loads: list[float] = [0.0] * workers
+        shards: list[list[int]] = [[] for _ in range(workers)]
+        for index in sorted(range(len(tests)), key=lambda v: durations.get(keys[v], default), reverse=True):
+            shard: int = loads.index(min(loads))
+            loads[shard] += durations.get(keys[index], default)
+            shards[shard].append(index)
+
+        if shards_dir.exists():
+            shutil.rmtree(shards_dir)
+        shards_dir.mkdir(parents=True)
+        cmds: list[list[str]] = []
+        for shard, indexes in enumerate(shards):
+            args_file: Path = shards_dir.joinpath(f"shard-{shard}.args")
+            args_file.write_bytes('\n'.join(tests[v] for v in sorted(indexes)).encode())
+            cmds.append([
+                python_file,
+                '-m', 'pytest',
+                f"--junit-xml={shards_dir.joinpath(f'shard-{shard}.xml').as_posix()}",
+                f"--log-file={shards_dir.joinpath(f'shard-{shard}.log').as_posix()}",
+                f"@{args_file.as_posix()}"
+            ])
+            self.__logger.info(
+                f"-- [{inspect.currentframe().f_code.co_name}] shard: {shard} tests: {len(indexes)} estimated: {loads[shard]:.1f}s"
+                f" execute: {cmds[-1]}"
+            )
+
+        failed: list[int] = []
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures: dict[Future, int] = {
+                executor.submit(
+                    subprocess.run,
+                    cmd,
+                    cwd=self.__project_dir,
+                    text=True,
+                    check=False,
+                    capture_output=True,
+                    timeout=self.__subprocess_timeout
+                ): shard for shard, cmd in enumerate(cmds)
+            }
+            for future in futures:
+                shard: int = futures[future]
+                completed: CompletedProcess[str] = future.result()
+                # shard output is logged as a whole, interleaved lines of parallel runs are unreadable
+                self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] shard: {shard} returncode: {completed.returncode}")
+                self.__logger.info(completed.stdout + completed.stderr)
+                if completed.returncode != 0:
+                    failed.append(shard)
+
+        self._merge_reports(
+            shard_files=[shards_dir.joinpath(f"shard-{v}.xml") for v in range(workers)],
+            report_file=report_file,
+            order={v: i for i, v in enumerate(keys)},
+            seconds=time.perf_counter() - start
+        )
+        self.__logger.info(f"-- [{inspect.currentframe().f_code.co_name}] report: '{report_file.as_posix()}' done in {time.perf_counter() - start:.1f}s")
+        if failed:
+            raise Exception(f"failed shards: {failed}")
+
+    def _merge_reports(self, shard_files: list[Path], report_file: Path, order: dict[tuple[str, str], int], seconds: float) -> None:
+        counts: dict[str, int] = {'errors': 0, 'failures': 0, 'skipped': 0, 'tests': 0}
+        testcases: list[ElementTree.Element] = []
+        timestamps: list[str] = []
+        hostname: str = ''
+        for file in shard_files:
+            if not file.exists():
+                continue
+            for testsuite in ElementTree.parse(file).getroot().iter('testsuite'):
+                for name in counts:
+                    counts[name] += int(testsuite.get(name, 0))
+                if testsuite.get('timestamp'):
+                    timestamps.append(testsuite.get('timestamp'))
+                hostname = hostname or testsuite.get('hostname', '')
+                testcases.extend(testsuite.iter('testcase'))
+        testcases.sort(key=lambda v: order.get((v.get('classname', ''), v.get('name', '')), len(order)))
+        testsuites: ElementTree.Element = ElementTree.Element('testsuites')
+        testsuite: ElementTree.Element = ElementTree.SubElement(testsuites, 'testsuite', {
+            'name': 'pytest',
+            **{k: str(v) for k, v in counts.items()},
+            'time': f"{seconds:.3f}",
+            'timestamp': min(timestamps) if timestamps else '',
+            'hostname': hostname
+        })
+        testsuite.extend(testcases)
+        report_file.parent.mkdir(parents=True, exist_ok=True)
+        ElementTree.ElementTree(testsuites).write(report_file, encoding='utf-8', xml_declaration=True)
+
+    def _get_test_key(self, test: str) -> tuple[str, str]:
+        # the junit 'classname' and 'name' pytest derives from a node id
+        path, bracket, params = test.partition('[')
+        names: list[str] = path.split('::')
+        names[0] = names[0].replace('/', '.')
+        if names[0].endswith('.py'):
+            names[0] = names[0][:-len('.py')]
+        names[-1] += bracket + params
+        return '.'.join(names[:-1]), names[-1]
+
     def _find_python(self, dir: None | str | object) -> str:
         try:
             if dir is None:
@@ -485,6 +937,44 @@ if __name__ == '__main__':
             default=0,
             help=f"subprocess timeout in seconds (default: %(default)s)"
         )
+        parser.add_argument(
+            '-bt', '--bench-threshold',
+            nargs='?',
+            type=float,
+            default=None,
+            help=f"allowed relative throughput drop for 'bench' (default: 0.25)"
+        )
+        parser.add_argument(
+            '-bb', '--bench-budget',
+            nargs='?',
+            type=float,
+            default=None,
+            help=f"cold start budget in milliseconds for 'bench' (default: 100)"
+        )
+        parser.add_argument(
+            '-bu', '--bench-update-baseline',
+            action='store_true',
+            help=f"write the 'bench' results to the baseline instead of comparing with it"
+        )
+        parser.add_argument(
+            '-j', '--jobs',
+            nargs='?',
+            type=int,
+            default=0,
+            help=f"tasks run at the same time, 0 runs every ready task (default: %(default)s)"
+        )
+        parser.add_argument(
+            '-tw', '--test-workers',
+            nargs='?',
+            type=int,
+            default=1,
+            help=f"parallel test processes for 'test', 0 uses the cpu count (default: %(default)s)"
+        )
+        parser.add_argument(
+            '-f', '--force',
+            action='store_true',
+            help=f"run tasks even when their inputs are unchanged"
+        )
         parser.add_argument(
             'commands',
             nargs='*',
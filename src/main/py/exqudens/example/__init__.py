@@ -1 +1,63 @@
-from exqudens.example.example import Example
+
+# 'typing' is not imported for this, type checkers treat the name as true
+TYPE_CHECKING: bool = False
+
+if TYPE_CHECKING:
+    from exqudens.example.example import Example
+    from exqudens.example.example_backend import ExampleBackend
+    from exqudens.example.example_cache import ExampleCache
+    from exqudens.example.example_chunk_reader import ExampleChunkReader
+    from exqudens.example.example_client import ExampleClient
+    from exqudens.example.example_codec import ExampleCodec
+    from exqudens.example.example_columns import ExampleColumns
+    from exqudens.example.example_etree_backend import ExampleEtreeBackend
+    from exqudens.example.example_instrumentation import ExampleInstrumentation
+    from exqudens.example.example_intern_pool import ExampleInternPool
+    from exqudens.example.example_lazy_dict import ExampleLazyDict
+    from exqudens.example.example_lxml_backend import ExampleLxmlBackend
+    from exqudens.example.example_node import ExampleNode
+    from exqudens.example.example_schema import ExampleSchema
+    from exqudens.example.example_selector import ExampleSelector
+    from exqudens.example.example_server import ExampleServer
+    from exqudens.example.example_stats import ExampleStats
+    from exqudens.example.example_tree import ExampleTree
+    from exqudens.example.example_xml_writer import ExampleXmlWriter
+    from exqudens.example.example_xmltodict_backend import ExampleXmltodictBackend
+
+# class name: module, a class module is imported on first attribute access
+__modules: dict[str, str] = {
+    'Example': 'exqudens.example.example',
+    'ExampleBackend': 'exqudens.example.example_backend',
+    'ExampleCache': 'exqudens.example.example_cache',
+    'ExampleChunkReader': 'exqudens.example.example_chunk_reader',
+    'ExampleClient': 'exqudens.example.example_client',
+    'ExampleCodec': 'exqudens.example.example_codec',
+    'ExampleColumns': 'exqudens.example.example_columns',
+    'ExampleEtreeBackend': 'exqudens.example.example_etree_backend',
+    'ExampleInstrumentation': 'exqudens.example.example_instrumentation',
+    'ExampleInternPool': 'exqudens.example.example_intern_pool',
+    'ExampleLazyDict': 'exqudens.example.example_lazy_dict',
+    'ExampleLxmlBackend': 'exqudens.example.example_lxml_backend',
+    'ExampleNode': 'exqudens.example.example_node',
+    'ExampleSchema': 'exqudens.example.example_schema',
+    'ExampleSelector': 'exqudens.example.example_selector',
+    'ExampleServer': 'exqudens.example.example_server',
+    'ExampleStats': 'exqudens.example.example_stats',
+    'ExampleTree': 'exqudens.example.example_tree',
+    'ExampleXmlWriter': 'exqudens.example.example_xml_writer',
+    'ExampleXmltodictBackend': 'exqudens.example.example_xmltodict_backend'
+}
+
+__all__: list[str] = list(__modules)
+
+def __getattr__(name: str) -> type:
+    module_name: None | str = __modules.get(name)
+    if module_name is None:
+        raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+    from importlib import import_module
+    value: type = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,22 +1,1174 @@
+from __future__ import annotations
+
+import os
+import re
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
 from logging import LoggerAdapter
 from logging import getLogger as logging_get_logger
+from mmap import ACCESS_READ
+from mmap import mmap
+from pathlib import Path
+from weakref import WeakKeyDictionary
+from xml.parsers import expat
+
+from exqudens.example.example_backend import ExampleBackend
+from exqudens.example.example_codec import ExampleCodec
+from exqudens.example.example_intern_pool import ExampleInternPool
+from exqudens.example.example_schema import ExampleSchema
+
+TYPE_CHECKING: bool = False
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+    from asyncio import Semaphore
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+
+    import xmltodict
+
+    from exqudens.example.example_cache import ExampleCache
+    from exqudens.example.example_columns import ExampleColumns
+    from exqudens.example.example_instrumentation import ExampleInstrumentation
+    from exqudens.example.example_lazy_dict import ExampleLazyDict
+    from exqudens.example.example_node import ExampleNode
+    from exqudens.example.example_selector import ExampleSelector
+    from exqudens.example.example_stats import ExampleStats
+    from exqudens.example.example_tree import ExampleTree
+    from exqudens.example.example_xml_writer import ExampleXmlWriter
 
 class Example:
     """
     Example class.
     """
     __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __chunk_size: int = 1024 * 1024
+    __split_size: int = 64 * 1024 * 1024
+    __tag_name_ends: bytes = b' \t\r\n/>'
+    __cache: None | ExampleCache = None
+    __executor: None | Executor = None
+    __backend: None | ExampleBackend = None
+    __instrumentation: None | ExampleInstrumentation = None
+    __schema: None | ExampleSchema = None
+    __interning: bool = False
+    __pool: None | ExampleInternPool = None
+    __max_concurrency: None | int = None
+    __semaphores: None | WeakKeyDictionary[AbstractEventLoop, Semaphore] = None
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        cache: None | ExampleCache | object = None,
+        executor: None | Executor | object = None,
+        max_concurrency: None | int | object = None,
+        backend: None | str | ExampleBackend | object = None,
+        instrumentation: None | ExampleInstrumentation | object = None,
+        schema: None | ExampleSchema | object = None,
+        interning: None | bool | ExampleInternPool | object = None
+    ) -> None:
         try:
-            pass
+            # optional collaborators are only imported when passed, creating an instance stays cheap
+            if cache is not None:
+                from exqudens.example.example_cache import ExampleCache
+                if not isinstance(cache, ExampleCache):
+                    raise Exception("'cache' is not an instance of 'ExampleCache'")
+            if executor is not None:
+                from concurrent.futures import Executor
+                from concurrent.futures import ThreadPoolExecutor
+                if not isinstance(executor, Executor):
+                    raise Exception("'executor' is not an instance of 'Executor'")
+                # parsers and bound methods are handed to the executor, they can not be pickled for another process
+                if not isinstance(executor, ThreadPoolExecutor):
+                    raise Exception("'executor' is not an instance of 'ThreadPoolExecutor'")
+            if max_concurrency is None:
+                max_concurrency = 4
+            if not isinstance(max_concurrency, int) or max_concurrency <= 0:
+                raise Exception("'max_concurrency' is not a positive 'int'")
+            if backend is not None and not isinstance(backend, (str, ExampleBackend)):
+                raise Exception("'backend' is not an instance of 'str' or 'ExampleBackend'")
+            if instrumentation is not None:
+                from exqudens.example.example_instrumentation import ExampleInstrumentation
+                if not isinstance(instrumentation, ExampleInstrumentation):
+                    raise Exception("'instrumentation' is not an instance of 'ExampleInstrumentation'")
+            if schema is not None and not isinstance(schema, ExampleSchema):
+                raise Exception("'schema' is not an instance of 'ExampleSchema'")
+            if interning is not None and not isinstance(interning, (bool, ExampleInternPool)):
+                raise Exception("'interning' is not an instance of 'bool' or 'ExampleInternPool'")
+
+            self.__cache = cache
+            self.__executor = executor
+            self.__backend = ExampleBackend.create(backend)
+            self.__instrumentation = instrumentation
+            self.__schema = schema
+            # 'True' interns per call, a pool instance is shared by all calls of this instance
+            self.__interning = interning is not None and interning is not False
+            self.__pool = interning if isinstance(interning, ExampleInternPool) else None
+            self.__max_concurrency = max_concurrency
+            self.__semaphores = WeakKeyDictionary()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @property
+    def backend(self) -> ExampleBackend:
+        return self.__backend
+
+    @property
+    def instrumentation(self) -> None | ExampleInstrumentation:
+        return self.__instrumentation
+
+    @property
+    def schema(self) -> None | ExampleSchema:
+        return self.__schema
+
+    @property
+    def pool(self) -> None | ExampleInternPool:
+        return self.__pool
+
+    def xml_to_dict(self, source: None | str | bytes | object = None) -> dict[str, object]:
+        try:
+            if source is None:
+                return dict()
+
+            if self.__instrumentation is not None:
+                return self.__instrumentation.run('xml_to_dict', self._xml_to_dict, source)
+            return self._xml_to_dict(source=source)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_file_to_dict(self, path: None | str | object, chunk_size: None | int | object = None) -> dict[str, object]:
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            if self.__instrumentation is not None:
+                return self.__instrumentation.run(
+                    'xml_file_to_dict',
+                    self._xml_file_to_dict,
+                    str(path),
+                    chunk_size,
+                    self.__cache,
+                    self.__backend,
+                    self.__schema,
+                    self._get_pool()
+                )
+            return self._xml_file_to_dict(
+                path=str(path),
+                chunk_size=chunk_size,
+                cache=self.__cache,
+                backend=self.__backend,
+                schema=self.__schema,
+                pool=self._get_pool()
+            )
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_to_dict_many(
+        self,
+        paths: None | list[str] | object,
+        workers: None | int | object = None,
+        ordered: bool = True
+    ) -> list[tuple[str, None | dict[str, object], None | Exception]]:
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures import as_completed
+
+        try:
+            if paths is None:
+                raise Exception("'paths' is none")
+            paths = [str(v) for v in paths]
+            if workers is not None and (not isinstance(workers, int) or workers <= 0):
+                raise Exception("'workers' is not a positive 'int'")
+
+            results: list[tuple[str, None | dict[str, object], None | Exception]] = []
+            if not paths:
+                return results
+
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures: dict[Future, str] = {
+                    executor.submit(self._xml_file_to_encoded, path, None, None, self.__backend, self.__schema, self._get_pool()): path
+                    for path in paths
+                }
+                for future in (futures if ordered else as_completed(futures)):
+                    path: str = futures[future]
+                    try:
+                        results.append((path, ExampleCodec.decode(future.result()), None))
+                    except Exception as e:
+                        self.__logger.info(f"failed: '{path}' {e}")
+                        results.append((path, None, e))
+            return results
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_file_to_dict_parallel(
+        self,
+        path: None | str | object,
+        item_path: None | str | object,
+        workers: None | int | object = None,
+        split_size: None | int | object = None
+    ) -> dict[str, object]:
+        from concurrent.futures import ProcessPoolExecutor
+
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            path = str(path)
+            if item_path is None:
+                raise Exception("'item_path' is none")
+            if not isinstance(item_path, str):
+                raise Exception("'item_path' is not an instance of 'str'")
+            item_names: list[str] = [v for v in item_path.split('/') if v]
+            if len(item_names) != 2:
+                raise Exception(f"'item_path' is not a '<root>/<item>' path: '{item_path}'")
+            if workers is not None and (not isinstance(workers, int) or workers <= 0):
+                raise Exception("'workers' is not a positive 'int'")
+            if split_size is None:
+                split_size = self.__split_size
+            if not isinstance(split_size, int) or split_size <= 0:
+                raise Exception("'split_size' is not a positive 'int'")
+
+            root_name: bytes = item_names[0].encode()
+            item_name: bytes = item_names[1].encode()
+            with open(path, 'rb') as file, mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                # records are split on their start tags, each chunk is wrapped in the original prolog and root tags
+                end: int = buffer.rfind(b'</' + root_name)
+                start, name = self._find_root_start(buffer=buffer)
+                if start < 0 or end < 0 or name != item_names[0]:
+                    return self._parse_buffer(self.__backend, buffer, self.__chunk_size, schema=self.__schema, pool=self._get_pool())
+                start = self._find_tag_end(buffer=buffer, start=start) + 1
+                header: bytes = buffer[:start]
+                bounds: list[int] = [start]
+                while bounds[-1] < end:
+                    offset: int = self._find_start_tag(buffer=buffer, name=item_name, start=bounds[-1] + split_size, end=end)
+                    bounds.append(end if offset < 0 else offset)
+
+            footer: bytes = b'</' + root_name + b'>'
+            chunk_count: int = len(bounds) - 1
+            result: None | bool | dict[str, object] = None
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as executor:
+                    chunks: Iterator[bytes] = executor.map(
+                        self._xml_chunk_to_dict,
+                        [path] * chunk_count,
+                        [header] * chunk_count,
+                        bounds[:-1],
+                        bounds[1:],
+                        [footer] * chunk_count,
+                        [self.__backend] * chunk_count,
+                        [self.__schema] * chunk_count,
+                        [self._get_pool() for _ in range(chunk_count)]
+                    )
+                    for chunk in chunks:
+                        result = self._merge_chunk(result=result, chunk=ExampleCodec.decode(chunk))
+                        if result is False:
+                            break
+            except expat.ExpatError as e:
+                # a split inside a nested record of the same name, a comment, cdata or a processing instruction
+                # leaves the previous chunk unclosed, a malformed document fails again with its own error
+                self.__logger.debug(f"chunk not parsed, parsing in one piece: {e}")
+                result = False
+            if result is False:
+                # root text converted by the schema can not be joined from parts, the file is parsed in one piece
+                return self.xml_file_to_dict(path)
+            if isinstance(result, dict) and '#text' in result:
+                result['#text'] = result.pop('#text')
+            return {item_names[0]: result}
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def iter_xml_to_dict(
+        self,
+        source: None | str | bytes | object,
+        item_path: None | str | object,
+        chunk_size: None | int | object = None
+    ) -> Iterator[object]:
+        try:
+            if source is None:
+                raise Exception("'source' is none")
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            parser, items = self._create_item_parser(item_path=item_path)
+            for chunk in self._iter_chunks(source=source, chunk_size=chunk_size):
+                parser.Parse(chunk, False)
+                while items:
+                    yield items.popleft()
+            parser.Parse(b'', True)
+            while items:
+                yield items.popleft()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def iter_xml_file_incremental(
+        self,
+        path: None | str | object,
+        item_path: None | str | object,
+        state_file: None | str | object = None,
+        chunk_size: None | int | object = None
+    ) -> Iterator[object]:
+        import json
+        from xml.sax.saxutils import quoteattr
+
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            path = str(path)
+            if item_path is None:
+                raise Exception("'item_path' is none")
+            if not isinstance(item_path, str):
+                raise Exception("'item_path' is not an instance of 'str'")
+            depth: int = len([v for v in item_path.split('/') if v])
+            if depth < 2:
+                raise Exception(f"'item_path' is not a child element path: '{item_path}'")
+            state_file = Path(path + '.state' if state_file is None else str(state_file))
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            state: None | dict[str, object] = None
+            if state_file.exists():
+                state = json.loads(state_file.read_bytes().decode())
+                if state.get('item_path') != item_path:
+                    state = None
+            with open(path, 'rb') as file:
+                size: int = os.fstat(file.fileno()).st_size
+                if size == 0:
+                    return None
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                    if state is not None and not self._is_appended(buffer, state):
+                        # the file was truncated or rewritten, it is converted again from the start
+                        self.__logger.info(f"not appended, restart: '{path}'")
+                        state = None
+                    if state is None:
+                        state = {'item_path': item_path, 'offset': 0, 'prolog': '', 'ancestors': [], 'records': 0}
+
+                    # the parser state at the offset is the prolog plus the start tags of the open ancestors
+                    offset: int = state['offset']
+                    prolog: bytes = bytes.fromhex(state['prolog'])
+                    encoding: str = self._prolog_encoding(prolog)
+                    prefix: bytes = prolog + ''.join(state['ancestors']).encode(encoding) if offset else b''
+                    parser, items = self._create_item_parser(item_path=item_path)
+                    start_handler: Callable[..., None] = parser.StartElementHandler
+                    end_handler: Callable[..., None] = parser.EndElementHandler
+                    stack: list[str] = []
+                    # [level, file position of the current item start tag]
+                    levels: list[int] = [0, 0]
+                    ends: deque[tuple[int, list[str]]] = deque()
+
+                    def start_element(name: str, attrs: list[str]) -> None:
+                        if not levels[0] and not offset:
+                            state['prolog'] = buffer[:parser.CurrentByteIndex].hex()
+                        levels[0] += 1
+                        if levels[0] == depth:
+                            levels[1] = offset + parser.CurrentByteIndex - len(prefix)
+                        elif levels[0] < depth:
+                            stack.append('<' + name + ''.join(' ' + attrs[i] + '=' + quoteattr(attrs[i + 1]) for i in range(0, len(attrs), 2)) + '>')
+                        start_handler(name, attrs)
+
+                    def end_element(name: str) -> None:
+                        count: int = len(items)
+                        end_handler(name)
+                        if levels[0] < depth:
+                            stack.pop()
+                        elif len(items) != count:
+                            position: int = offset + parser.CurrentByteIndex - len(prefix)
+                            # an empty element tag ends at the reported position, a closing tag starts there
+                            if buffer[position - 2:position] != b'/>' or self._find_tag_end(buffer, levels[1]) + 1 != position:
+                                position = self._find_tag_end(buffer, position) + 1
+                            ends.append((position, list(stack)))
+                        levels[0] -= 1
+
+                    parser.StartElementHandler = start_element
+                    parser.EndElementHandler = end_element
+                    last: None | tuple[int, list[str]] = None
+                    try:
+                        parser.Parse(prefix, False)
+                        for start in range(offset, size, chunk_size):
+                            # the document may still be growing, it is never finished with a final 'Parse'
+                            parser.Parse(buffer[start:start + chunk_size], False)
+                            while items:
+                                item: object = items.popleft()
+                                last = ends.popleft()
+                                state['records'] += 1
+                                yield item
+                    finally:
+                        if last is not None:
+                            state['offset'] = last[0]
+                            state['ancestors'] = last[1]
+                            state['head'] = buffer[:64].hex()
+                            state['check'] = buffer[max(0, last[0] - 64):last[0]].hex()
+                            self._write_state(state_file, state)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    async def axml_to_dict(
+        self,
+        source: None | str | bytes | object = None,
+        chunk_size: None | int | object = None
+    ) -> dict[str, object]:
+        import xmltodict
+
+        try:
+            if source is None:
+                return dict()
+            if not self._is_async_reader(source) and not hasattr(source, '__aiter__'):
+                return await self._run_limited(self.xml_to_dict, source)
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            handler: xmltodict._DictSAXHandler = xmltodict._DictSAXHandler()
+            parser = self._create_parser(handler=handler, pool=self._get_pool())
+            async for chunk in self._aiter_chunks(source=source, chunk_size=chunk_size):
+                await self._run_limited(parser.Parse, chunk, False)
+            await self._run_limited(parser.Parse, b'', True)
+            return handler.item
         except Exception as e:
             self.__logger.info(e, exc_info=True)
             raise e
 
-    def xml_to_dict(self) -> dict[str, object]:
+    async def aiter_xml_to_dict(
+        self,
+        source: None | str | bytes | object,
+        item_path: None | str | object,
+        chunk_size: None | int | object = None
+    ) -> AsyncIterator[object]:
         try:
+            if source is None:
+                raise Exception("'source' is none")
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            # the next chunk is only read once the previous one is parsed and its items are consumed
+            parser, items = self._create_item_parser(item_path=item_path)
+            async for chunk in self._aiter_chunks(source=source, chunk_size=chunk_size):
+                await self._run_limited(parser.Parse, chunk, False)
+                while items:
+                    yield items.popleft()
+            await self._run_limited(parser.Parse, b'', True)
+            while items:
+                yield items.popleft()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_to_dict_selected(
+        self,
+        source: None | str | bytes | object,
+        selector: None | ExampleSelector | list[str] | object,
+        chunk_size: None | int | object = None
+    ) -> dict[str, object]:
+        import xmltodict
+        
+        from exqudens.example.example_selector import ExampleSelector
+
+        try:
+            if source is None:
+                raise Exception("'source' is none")
+            if selector is None:
+                raise Exception("'selector' is none")
+            if not isinstance(selector, ExampleSelector):
+                selector = ExampleSelector(selector)
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            # open path elements: (trie node, item); unselected subtrees only move a depth counter
+            result: dict[str, object] = {}
+            stack: list[tuple[dict[str, object], dict[str, object]]] = [(selector.trie, result)]
+            depth: list[int] = [0]
+            handler: xmltodict._DictSAXHandler = xmltodict._DictSAXHandler()
+            leaf: list[object] = []
+
+            def push(item: dict[str, object], key: str, value: object) -> None:
+                if key not in item:
+                    item[key] = value
+                elif isinstance(item[key], list):
+                    item[key].append(value)
+                else:
+                    item[key] = [item[key], value]
+
+            def start_element(name: str, attrs: list[str]) -> None:
+                node: None | dict[str, object] = stack[-1][0]['children'].get(name)
+                if node is None:
+                    depth[0] = 1
+                    parser.StartElementHandler = skip_start_element
+                    parser.EndElementHandler = skip_end_element
+                elif node['selected']:
+                    depth[0] = 1
+                    leaf[:] = [name, attrs, []]
+                    parser.StartElementHandler = capture_start_element
+                    parser.EndElementHandler = capture_end_element
+                    parser.CharacterDataHandler = leaf[2].append
+                else:
+                    attributes: set[str] = node['attributes']
+                    item: dict[str, object] = {'@' + k: v for k, v in zip(attrs[0::2], attrs[1::2]) if k in attributes}
+                    stack.append((node, item))
+
+            def end_element(name: str) -> None:
+                _, item = stack.pop()
+                push(stack[-1][1], name, item or None)
+
+            def skip_start_element(name: str, attrs: list[str]) -> None:
+                depth[0] += 1
+
+            def skip_end_element(name: str) -> None:
+                depth[0] -= 1
+                if not depth[0]:
+                    parser.StartElementHandler = start_element
+                    parser.EndElementHandler = end_element
+
+            def capture_start_element(name: str, attrs: list[str]) -> None:
+                if leaf:
+                    # the selected element is not a leaf, replay it into the full handler
+                    handler.item = None
+                    handler.startElement(leaf[0], leaf[1])
+                    if leaf[2]:
+                        handler.characters(''.join(leaf[2]))
+                    parser.CharacterDataHandler = handler.characters
+                    leaf.clear()
+                depth[0] += 1
+                handler.startElement(name, attrs)
+
+            def capture_end_element(name: str) -> None:
+                depth[0] -= 1
+                if depth[0]:
+                    handler.endElement(name)
+                    return
+                parser.StartElementHandler = start_element
+                parser.EndElementHandler = end_element
+                parser.CharacterDataHandler = None
+                if leaf:
+                    _, attrs, data = leaf
+                    text: None | str = ''.join(data).strip() or None
+                    value: None | str | dict[str, object] = text
+                    if attrs:
+                        value = {'@' + k: v for k, v in zip(attrs[0::2], attrs[1::2])}
+                        if text:
+                            value['#text'] = text
+                    leaf.clear()
+                else:
+                    handler.endElement(name)
+                    value = handler.item[name]
+                push(stack[-1][1], name, value)
+
+            parser = ExampleBackend._create_expat_parser()
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+            for chunk in self._iter_chunks(source=source, chunk_size=chunk_size):
+                parser.Parse(chunk, False)
+            parser.Parse(b'', True)
+
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_to_columns(
+        self,
+        source: None | str | bytes | object,
+        item_path: None | str | object,
+        fields: None | list[str] | object,
+        types: None | dict[str, object] | object = None,
+        numpy: None | bool | object = None,
+        chunk_size: None | int | object = None
+    ) -> dict[str, object]:
+        from exqudens.example.example_columns import ExampleColumns
+
+        try:
+            if source is None:
+                raise Exception("'source' is none")
+            if item_path is None:
+                raise Exception("'item_path' is none")
+            if not isinstance(item_path, str):
+                raise Exception("'item_path' is not an instance of 'str'")
+            item_names: list[str] = [v for v in item_path.split('/') if v]
+            if not item_names:
+                raise Exception("'item_path' is empty")
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+            columns: ExampleColumns = ExampleColumns(fields=fields, types=types, numpy=numpy)
+
+            # field paths are relative to the record: 'c', 'c/d', '@k', 'c/@k', '#text'
+            texts: dict[str, int] = {}
+            attributes: dict[str, dict[str, int]] = {}
+            for i, field in enumerate(columns.fields):
+                names: list[str] = [v for v in field.split('/') if v]
+                if not names:
+                    raise Exception(f"field is empty: '{field}'")
+                if names[-1].startswith('@'):
+                    attributes.setdefault('/'.join(names[:-1]), {})[names[-1][1:]] = i
+                else:
+                    texts['/'.join(names[:-1] if names[-1] == '#text' else names)] = i
+
+            path: list[str] = []
+            # open record elements: (relative path, direct text parts or None)
+            frames: list[tuple[str, None | list[str]]] = []
+            row: list[None | str] = []
+
+            def start_element(name: str, attrs: list[str]) -> None:
+                path.append(name)
+                if path == item_names:
+                    row[:] = [None] * len(columns.fields)
+                    parser.StartElementHandler = record_start_element
+                    parser.EndElementHandler = record_end_element
+                    record_start_element(name, attrs, '')
+
+            def end_element(name: str) -> None:
+                path.pop()
+
+            def record_start_element(name: str, attrs: list[str], relative: None | str = None) -> None:
+                if relative is None:
+                    relative = frames[-1][0] + '/' + name if frames[-1][0] else name
+                indexes: None | dict[str, int] = attributes.get(relative)
+                if indexes:
+                    for k, v in zip(attrs[0::2], attrs[1::2]):
+                        i: None | int = indexes.get(k)
+                        if i is not None and row[i] is None:
+                            row[i] = v
+                text: None | list[str] = [] if relative in texts else None
+                frames.append((relative, text))
+                parser.CharacterDataHandler = None if text is None else text.append
+
+            def record_end_element(name: str) -> None:
+                relative, text = frames.pop()
+                if text is not None:
+                    i: int = texts[relative]
+                    if row[i] is None:
+                        row[i] = ''.join(text).strip() or None
+                if frames:
+                    text = frames[-1][1]
+                    parser.CharacterDataHandler = None if text is None else text.append
+                    return
+                columns.append(row)
+                path.pop()
+                parser.StartElementHandler = start_element
+                parser.EndElementHandler = end_element
+                parser.CharacterDataHandler = None
+
+            parser = ExampleBackend._create_expat_parser()
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+            for chunk in self._iter_chunks(source=source, chunk_size=chunk_size):
+                parser.Parse(chunk, False)
+            parser.Parse(b'', True)
+
+            return columns.to_dict()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_to_node(self, source: None | str | bytes | object, chunk_size: None | int | object = None) -> ExampleNode:
+        from exqudens.example.example_node import ExampleNode
+        from exqudens.example.example_tree import ExampleTree
+
+        try:
+            if source is None:
+                raise Exception("'source' is none")
+            if chunk_size is None:
+                chunk_size = self.__chunk_size
+            if not isinstance(chunk_size, int) or chunk_size <= 0:
+                raise Exception("'chunk_size' is not a positive 'int'")
+
+            tree: ExampleTree = ExampleTree()
+            parser = ExampleBackend._create_expat_parser()
+            parser.StartElementHandler = tree.start_element
+            parser.EndElementHandler = tree.end_element
+            parser.CharacterDataHandler = tree.characters
+            for chunk in self._iter_chunks(source=source, chunk_size=chunk_size):
+                parser.Parse(chunk, False)
+            parser.Parse(b'', True)
+            tree.close()
+
+            return ExampleNode(tree)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_to_lazy_dict(self, source: None | str | bytes | mmap | object) -> ExampleLazyDict:
+        from exqudens.example.example_lazy_dict import ExampleLazyDict
+
+        try:
+            if source is None:
+                raise Exception("'source' is none")
+            if isinstance(source, str):
+                source = source.encode()
+            if not isinstance(source, (bytes, mmap)):
+                raise Exception("'source' is not an instance of 'str', 'bytes' or 'mmap'")
+
+            return ExampleLazyDict(source, 0, len(source), element=False)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_file_to_lazy_dict(self, path: None | str | object) -> ExampleLazyDict:
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+
+            with open(str(path), 'rb') as file:
+                if Path(str(path)).stat().st_size == 0:
+                    return self.xml_to_lazy_dict(b'')
+                # the mapping stays open for as long as the lazy dict references it
+                return self.xml_to_lazy_dict(mmap(file.fileno(), 0, access=ACCESS_READ))
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _xml_to_dict(self, source: str | bytes | object, stats: None | ExampleStats = None) -> dict[str, object]:
+        try:
+            # 'str' input is parsed as utf-8 whatever its declaration says, same as 'xmltodict.parse'
+            encoding: None | str = 'utf-8' if isinstance(source, str) else None
+            phases: None | dict[str, float] = None if stats is None else stats.phases
+            # a schema without a key has a converter the cache can not tell apart from another
+            if isinstance(source, str):
+                source = source.encode()
+            if not isinstance(source, bytes):
+                chunks: Iterator[bytes | memoryview] = self._iter_chunks(source=source, chunk_size=self.__chunk_size, stats=stats)
+                return self.__backend.parse(chunks, encoding=encoding, phases=phases, schema=self.__schema, pool=self._get_pool())
+            if self.__cache is None or self.__schema is not None and self.__schema.key is None:
+                return self._parse_buffer(self.__backend, source, self.__chunk_size, encoding, phases, self.__schema, self._get_pool(), stats)
+
+            start: float = 0.0 if stats is None else time.perf_counter()
+            options: dict[str, object] = {}
+            if encoding is not None and self._declared_encoding(source) != 'utf-8':
+                # the same document as 'str' and as 'bytes' decodes differently, the key keeps them apart
+                options['encoding'] = encoding
+            if self.__schema is not None:
+                options['schema'] = self.__schema.key
+            key: str = self.__cache.key(source, options)
+            found, result = self.__cache.get(key)
+            if stats is not None:
+                stats.phases['cache'] = time.perf_counter() - start
+            if not found:
+                result = self._parse_buffer(self.__backend, source, self.__chunk_size, encoding, phases, self.__schema, self._get_pool(), stats)
+                start = 0.0 if stats is None else time.perf_counter()
+                self.__cache.put(key, result)
+                if stats is not None:
+                    stats.phases['postprocess'] = time.perf_counter() - start
+            elif stats is not None:
+                stats.bytes_in = len(source)
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _xml_file_to_dict(
+        cls,
+        path: str,
+        chunk_size: None | int = None,
+        cache: None | ExampleCache = None,
+        backend: None | str | ExampleBackend = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None,
+        stats: None | ExampleStats = None
+    ) -> dict[str, object]:
+        try:
+            backend = ExampleBackend.create(backend)
+            phases: None | dict[str, float] = None if stats is None else stats.phases
+            with open(path, 'rb') as file:
+                if Path(path).stat().st_size == 0:
+                    return backend.parse([b''], schema=schema, pool=pool)
+                # the parser reads slices of the mapped file, no bytes or str copy of the document is made
+                with mmap(file.fileno(), 0, access=ACCESS_READ) as buffer:
+                    key: None | str = None
+                    if cache is not None and (schema is None or schema.key is not None):
+                        start: float = 0.0 if stats is None else time.perf_counter()
+                        key = cache.key(buffer, None if schema is None else {'schema': schema.key})
+                        found, result = cache.get(key)
+                        if stats is not None:
+                            stats.phases['cache'] = time.perf_counter() - start
+                        if found:
+                            if stats is not None:
+                                stats.bytes_in = len(buffer)
+                            return result
+                    result: dict[str, object] = cls._parse_buffer(backend, buffer, chunk_size or cls.__chunk_size, None, phases, schema, pool, stats)
+                    if key is not None:
+                        start = 0.0 if stats is None else time.perf_counter()
+                        cache.put(key, result)
+                        if stats is not None:
+                            stats.phases['postprocess'] = time.perf_counter() - start
+                    return result
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _parse_buffer(
+        cls,
+        backend: ExampleBackend,
+        source: bytes | mmap,
+        chunk_size: int,
+        encoding: None | str = None,
+        phases: None | dict[str, float] = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None,
+        stats: None | ExampleStats = None
+    ) -> dict[str, object]:
+        # the slices are a list, a backend may read them twice, and they are all released before a mapped file is closed
+        with memoryview(source) as view:
+            chunks: list[memoryview] = [view[offset:offset + chunk_size] for offset in range(0, len(view), chunk_size)]
+        try:
+            if stats is not None:
+                stats.bytes_in += len(source)
+            return backend.parse(chunks, encoding=encoding, phases=phases, schema=schema, pool=pool)
+        finally:
+            for chunk in chunks:
+                chunk.release()
+
+    @classmethod
+    def _xml_file_to_encoded(
+        cls,
+        path: str,
+        chunk_size: None | int = None,
+        cache: None | ExampleCache = None,
+        backend: None | str | ExampleBackend = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> bytes:
+        return ExampleCodec.encode(cls._xml_file_to_dict(path, chunk_size, cache, backend, schema, pool))
+
+    @classmethod
+    def _xml_chunk_to_dict(
+        cls,
+        path: str,
+        header: bytes,
+        start: int,
+        end: int,
+        footer: bytes,
+        backend: None | str | ExampleBackend = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> bytes:
+        try:
+            with open(path, 'rb') as file:
+                file.seek(start)
+                chunk: bytes = file.read(end - start)
+            result: dict[str, object] = ExampleBackend.create(backend).parse([b''.join([header, chunk, footer])], schema=schema, pool=pool)
+            # results cross the process boundary encoded, the executor only copies the bytes
+            return ExampleCodec.encode(next(iter(result.values())))
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    def _is_appended(self, buffer: mmap, state: dict[str, object]) -> bool:
+        offset: int = state['offset']
+        if len(buffer) < offset:
+            return False
+        head: bytes = bytes.fromhex(state.get('head', ''))
+        check: bytes = bytes.fromhex(state.get('check', ''))
+        return buffer[:len(head)] == head and buffer[offset - len(check):offset] == check
+
+    def _declared_encoding(self, source: bytes) -> str:
+        import codecs
+
+        if not source.startswith(b'<?xml'):
+            return 'utf-8'
+        name: str = self._prolog_encoding(source[:source.find(b'?>')])
+        try:
+            return codecs.lookup(name).name
+        except LookupError:
+            # the parser reports an unknown encoding itself
+            return name
+
+    def _prolog_encoding(self, prolog: bytes) -> str:
+        match: None | re.Match[bytes] = re.search(rb'encoding\s*=\s*["\']([A-Za-z0-9._-]+)["\']', prolog)
+        return 'utf-8' if match is None else match.group(1).decode()
+
+    def _find_tag_end(self, buffer: mmap | bytes, start: int) -> int:
+        # '>' may appear inside quoted attribute values of an empty element tag
+        quote: None | int = None
+        for i in range(start, len(buffer)):
+            c: int = buffer[i]
+            if quote is not None:
+                if c == quote:
+                    quote = None
+            elif c == 0x3e:
+                return i
+            elif c == 0x22 or c == 0x27:
+                quote = c
+        raise Exception(f"unterminated tag at: {start}")
+
+    def _write_state(self, state_file: Path, state: dict[str, object]) -> None:
+        import json
+
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file: Path = state_file.with_name(state_file.name + '.tmp')
+        tmp_file.write_bytes(json.dumps(state).encode())
+        os.replace(tmp_file, state_file)
+
+    def _get_pool(self) -> None | ExampleInternPool:
+        if not self.__interning:
+            return None
+        return ExampleInternPool() if self.__pool is None else self.__pool
+
+    def _find_root_start(self, buffer: mmap | bytes) -> tuple[int, None | str]:
+        from xml.parsers import expat
+
+        # the prolog may hold comments, processing instructions and a doctype that mention the root name
+        root: list[object] = [-1, None]
+
+        def start_element(name: str, attributes: dict[str, str]) -> None:
+            root[:] = [parser.CurrentByteIndex, name]
+            raise StopIteration
+
+        parser: expat.XMLParserType = expat.ParserCreate()
+        parser.StartElementHandler = start_element
+        try:
+            with memoryview(buffer) as view:
+                for i in range(0, len(view), self.__chunk_size):
+                    parser.Parse(view[i:i + self.__chunk_size], False)
+        except (StopIteration, expat.ExpatError):
             pass
+        return root[0], root[1]
+
+    def _find_start_tag(self, buffer: mmap | bytes, name: bytes, start: int, end: int) -> int:
+        try:
+            tag: bytes = b'<' + name
+            offset: int = buffer.find(tag, start, end)
+            while offset >= 0 and buffer[offset + len(tag):offset + len(tag) + 1] not in self.__tag_name_ends:
+                offset = buffer.find(tag, offset + len(tag), end)
+            return offset
         except Exception as e:
             self.__logger.info(e, exc_info=True)
             raise e
+
+    def _merge_chunk(self, result: None | bool | dict[str, object], chunk: None | str | object) -> None | bool | dict[str, object]:
+        try:
+            # a chunk with only root text parses to that text, the text is joined the way 'xmltodict' joins it
+            if isinstance(chunk, str):
+                chunk = {'#text': chunk}
+            if chunk is None:
+                return result
+            if not isinstance(chunk, dict) or not isinstance(chunk.get('#text', ''), str):
+                return False
+            if result is None:
+                return dict(chunk)
+            for key, value in chunk.items():
+                if key.startswith('@'):
+                    continue
+                if key not in result:
+                    result[key] = value
+                    continue
+                if key == '#text':
+                    result[key] += value
+                    continue
+                if not isinstance(result[key], list):
+                    result[key] = [result[key]]
+                if isinstance(value, list):
+                    result[key].extend(value)
+                else:
+                    result[key].append(value)
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _create_item_parser(self, item_path: None | str | object) -> tuple[object, deque[object]]:
+        import xmltodict
+
+        try:
+            if item_path is None:
+                raise Exception("'item_path' is none")
+            if not isinstance(item_path, str):
+                raise Exception("'item_path' is not an instance of 'str'")
+            item_names: list[str] = [v for v in item_path.split('/') if v]
+            if not item_names:
+                raise Exception("'item_path' is empty")
+
+            items: deque[object] = deque()
+            pool: None | ExampleInternPool = self._get_pool()
+            # the item text is restored here, outside the handler hooks, so the schema is applied to it here too
+            node: None | dict[str, object] = None if self.__schema is None else self.__schema.trie
+            for name in item_names:
+                node = None if node is None else node['children'].get(name)
+            converter: None | Callable[[str], object] = None if node is None else node['type']
+
+            def item_callback(path: list[tuple[str, object]], item: object) -> bool:
+                if [name for name, _ in path] != item_names:
+                    return True
+                # the handler drops the item text at the streaming depth, restore it the way 'xml_to_dict' does
+                data: None | str = ''.join(handler.data).strip() or None
+                if data is not None:
+                    if pool is not None:
+                        data = pool.values.get(data) or pool.intern(data)
+                    if converter is not None:
+                        data = self.__schema.convert(node, converter, data)
+                if isinstance(item, dict):
+                    if data is not None:
+                        item['#text'] = data
+                else:
+                    item = data
+                items.append(item)
+                return True
+
+            handler: xmltodict._DictSAXHandler = xmltodict._DictSAXHandler(
+                item_depth=len(item_names),
+                item_callback=item_callback
+            )
+            return self._create_parser(handler=handler, pool=pool), items
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _create_parser(self, handler: xmltodict._DictSAXHandler, pool: None | ExampleInternPool = None) -> object:
+        from exqudens.example.example_xmltodict_backend import ExampleXmltodictBackend
+
+        try:
+            # streamed input takes the same schema and interning hooks as the 'xmltodict' backend
+            return ExampleXmltodictBackend()._create_parser(handler, None, self.__schema, pool)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def dict_to_xml(
+        self,
+        input_dict: None | dict[str, object] | object,
+        output: None | object = None,
+        full_document: bool = True,
+        encoding: None | str = None,
+        buffer_size: None | int | object = None
+    ) -> None | str:
+        from exqudens.example.example_xml_writer import ExampleXmlWriter
+
+        try:
+            if input_dict is None:
+                raise Exception("'input_dict' is none")
+            if not isinstance(input_dict, dict):
+                raise Exception("'input_dict' is not an instance of 'dict'")
+            if full_document and (len(input_dict) != 1 or isinstance(next(iter(input_dict.values())), list)):
+                raise Exception("document must have exactly one root")
+
+            writer: ExampleXmlWriter = ExampleXmlWriter(output=output, encoding=encoding, buffer_size=buffer_size)
+            if full_document:
+                writer.declaration()
+            for key, value in input_dict.items():
+                writer.element(key, value)
+            writer.flush()
+            return writer.getvalue() if output is None else None
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def records_to_xml(
+        self,
+        records: None | Iterable[object] | object,
+        item_path: None | str | object,
+        output: None | object = None,
+        root_attributes: None | dict[str, object] = None,
+        encoding: None | str = None,
+        buffer_size: None | int | object = None
+    ) -> None | str:
+        from exqudens.example.example_xml_writer import ExampleXmlWriter
+
+        try:
+            if records is None:
+                raise Exception("'records' is none")
+            if item_path is None:
+                raise Exception("'item_path' is none")
+            if not isinstance(item_path, str):
+                raise Exception("'item_path' is not an instance of 'str'")
+            item_names: list[str] = [v for v in item_path.split('/') if v]
+            if len(item_names) != 2:
+                raise Exception(f"'item_path' is not a '<root>/<item>' path: '{item_path}'")
+
+            writer: ExampleXmlWriter = ExampleXmlWriter(output=output, encoding=encoding, buffer_size=buffer_size)
+            writer.declaration()
+            writer.start(item_names[0], root_attributes)
+            for record in records:
+                writer.element(item_names[1], record)
+            writer.end(item_names[0])
+            writer.flush()
+            return writer.getvalue() if output is None else None
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    async def _run_limited(self, function: Callable[..., object], *args: object) -> object:
+        import asyncio
+
+        try:
+            loop: AbstractEventLoop = asyncio.get_running_loop()
+            semaphore: None | Semaphore = self.__semaphores.get(loop)
+            if semaphore is None:
+                semaphore = asyncio.Semaphore(self.__max_concurrency)
+                self.__semaphores[loop] = semaphore
+            async with semaphore:
+                return await loop.run_in_executor(self.__executor, function, *args)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _is_async_reader(self, source: object) -> bool:
+        import asyncio
+
+        return hasattr(source, 'read') and asyncio.iscoroutinefunction(source.read)
+
+    async def _aiter_chunks(self, source: str | bytes | object, chunk_size: int) -> AsyncIterator[bytes | memoryview]:
+        try:
+            if self._is_async_reader(source):
+                while True:
+                    chunk: str | bytes = await source.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk.encode() if isinstance(chunk, str) else chunk
+            elif hasattr(source, '__aiter__'):
+                async for chunk in source:
+                    yield chunk.encode() if isinstance(chunk, str) else chunk
+            else:
+                for chunk in self._iter_chunks(source=source, chunk_size=chunk_size):
+                    yield chunk
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _iter_chunks(cls, source: str | bytes | object, chunk_size: int, stats: None | ExampleStats = None) -> Iterator[bytes | memoryview]:
+        try:
+            if stats is not None:
+                for chunk in cls._iter_chunks(source=source, chunk_size=chunk_size):
+                    stats.bytes_in += len(chunk)
+                    yield chunk
+                return None
+            if isinstance(source, str):
+                source = source.encode()
+            if isinstance(source, (bytes, bytearray, memoryview, mmap)):
+                with memoryview(source) as view:
+                    for offset in range(0, len(view), chunk_size):
+                        # each slice is released once consumed, a mapped file can be closed after a failed parse
+                        with view[offset:offset + chunk_size] as chunk:
+                            yield chunk
+            elif hasattr(source, 'read'):
+                while True:
+                    chunk: str | bytes = source.read(chunk_size)
+                    if not chunk:
+                        break
+                    yield chunk.encode() if isinstance(chunk, str) else chunk
+            else:
+                for chunk in source:
+                    yield chunk.encode() if isinstance(chunk, str) else chunk
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
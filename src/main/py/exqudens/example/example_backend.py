@@ -0,0 +1,116 @@
+from collections.abc import Iterable
+from collections.abc import Iterator
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+from exqudens.example.example_intern_pool import ExampleInternPool
+from exqudens.example.example_schema import ExampleSchema
+
+class ExampleBackend:
+    """
+    ExampleBackend class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __names: list[str] = ['lxml', 'etree', 'xmltodict']
+    name: str = ''
+
+    @classmethod
+    def names(cls) -> list[str]:
+        try:
+            return [name for name in cls.__names if cls._get_class(name).available()]
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def create(cls, name: None | str | object = None) -> 'ExampleBackend':
+        try:
+            if isinstance(name, ExampleBackend):
+                return name
+            if name is None or name == 'auto':
+                # preference order follows measured throughput, the first installed backend wins
+                # and the backends after it are not imported
+                name = next(name for name in cls.__names if cls._get_class(name).available())
+            if name not in cls.__names:
+                raise Exception(f"unsupported backend: '{name}' supported: {cls.__names}")
+            backend_class: type[ExampleBackend] = cls._get_class(name)
+            if not backend_class.available():
+                raise Exception(f"backend is not available: '{name}'")
+            return backend_class()
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def available(cls) -> bool:
+        return True
+
+    def parse(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        encoding: None | str = None,
+        phases: None | dict[str, float] = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> dict[str, object]:
+        raise NotImplementedError(f"'{self.__class__.__name__}.parse'")
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, ExampleBackend) and other.name == self.name
+
+    def __hash__(self) -> int:
+        return hash(self.name)
+
+    @classmethod
+    def _get_class(cls, name: str) -> type['ExampleBackend']:
+        if name == 'lxml':
+            from exqudens.example.example_lxml_backend import ExampleLxmlBackend
+            return ExampleLxmlBackend
+        if name == 'etree':
+            from exqudens.example.example_etree_backend import ExampleEtreeBackend
+            return ExampleEtreeBackend
+        from exqudens.example.example_xmltodict_backend import ExampleXmltodictBackend
+        return ExampleXmltodictBackend
+
+    @classmethod
+    def _push(cls, item: dict[str, object], key: str, value: object, force_list: bool = False) -> None:
+        if key not in item:
+            item[key] = [value] if force_list else value
+        elif isinstance(item[key], list):
+            item[key].append(value)
+        else:
+            item[key] = [item[key], value]
+
+    @classmethod
+    def _create_expat_parser(cls, encoding: None | str = None) -> object:
+        from xml.parsers import expat
+
+        # entity declarations are rejected the same way 'xmltodict.parse' rejects them
+        def forbid_entities(*args: object) -> None:
+            raise ValueError("entities are disabled")
+
+        parser: expat.XMLParserType = expat.ParserCreate(encoding, None)
+        parser.ordered_attributes = True
+        parser.buffer_text = True
+        parser.EntityDeclHandler = forbid_entities
+        return parser
+
+    @classmethod
+    def _guard(cls, chunks: Iterable[bytes | memoryview], encoding: None | str = None) -> Iterator[bytes | memoryview]:
+        from xml.parsers import expat
+
+        # entity declarations can only be in the doctype, so only the prolog is parsed
+        # and chunks after the root start tag pass unchecked
+        def stop(*args: object) -> None:
+            raise StopIteration
+
+        parser: None | expat.XMLParserType = cls._create_expat_parser(encoding)
+        parser.StartElementHandler = stop
+        for chunk in chunks:
+            if parser is not None:
+                try:
+                    parser.Parse(chunk, False)
+                except (StopIteration, expat.ExpatError):
+                    # malformed input is reported by the backend parser itself
+                    parser = None
+            yield chunk
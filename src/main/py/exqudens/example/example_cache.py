@@ -0,0 +1,168 @@
+import os
+import pickle
+import hashlib
+from collections import OrderedDict
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from pathlib import Path
+from threading import Lock
+
+class ExampleCache:
+    """
+    ExampleCache class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __max_size: None | int = None
+    __max_dir_size: None | int = None
+    __dir: None | str = None
+    __entries: None | OrderedDict[str, bytes] = None
+    __size: int = 0
+    __dir_size: int = 0
+    __lock: None | object = None
+    __hits: int = 0
+    __disk_hits: int = 0
+    __misses: int = 0
+
+    def __init__(
+        self,
+        max_size: None | int | object = None,
+        dir: None | str | object = None,
+        max_dir_size: None | int | object = None
+    ) -> None:
+        try:
+            if max_size is None:
+                max_size = 64 * 1024 * 1024
+            if not isinstance(max_size, int) or max_size < 0:
+                raise Exception("'max_size' is not a non negative 'int'")
+            if max_dir_size is None:
+                max_dir_size = 1024 * 1024 * 1024
+            if not isinstance(max_dir_size, int) or max_dir_size < 0:
+                raise Exception("'max_dir_size' is not a non negative 'int'")
+
+            self.__max_size = max_size
+            self.__max_dir_size = max_dir_size
+            self.__dir = None if dir is None else Path(str(dir)).as_posix()
+            self.__entries = OrderedDict()
+            self.__lock = Lock()
+
+            if self.__dir is not None:
+                Path(self.__dir).mkdir(parents=True, exist_ok=True)
+                self.__dir_size = sum(v.stat().st_size for v in Path(self.__dir).glob('*.pickle'))
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def key(self, data: bytes | memoryview | object, options: None | dict[str, object] = None) -> str:
+        try:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(data)
+            if options:
+                digest.update(repr(sorted(options.items())).encode())
+            return digest.hexdigest()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def get(self, key: str) -> tuple[bool, object]:
+        try:
+            with self.__lock:
+                value: None | bytes = self.__entries.get(key)
+                if value is not None:
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return True, pickle.loads(value)
+
+                if self.__dir is not None:
+                    path: Path = Path(self.__dir).joinpath(f"{key}.pickle")
+                    if path.exists():
+                        value = path.read_bytes()
+                        os.utime(path)
+                        self.__disk_hits += 1
+                        self._put_memory(key=key, value=value)
+                        return True, pickle.loads(value)
+
+                self.__misses += 1
+                return False, None
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def put(self, key: str, value: object) -> None:
+        try:
+            data: bytes = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            with self.__lock:
+                self._put_memory(key=key, value=data)
+                if self.__dir is not None:
+                    self._put_dir(key=key, value=data)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def clear(self) -> None:
+        try:
+            with self.__lock:
+                self.__entries.clear()
+                self.__size = 0
+                if self.__dir is not None:
+                    for path in Path(self.__dir).glob('*.pickle'):
+                        path.unlink(missing_ok=True)
+                    self.__dir_size = 0
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def stats(self) -> dict[str, int]:
+        try:
+            with self.__lock:
+                return {
+                    'hits': self.__hits,
+                    'disk_hits': self.__disk_hits,
+                    'misses': self.__misses,
+                    'entries': len(self.__entries),
+                    'size': self.__size,
+                    'dir_size': self.__dir_size
+                }
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _put_memory(self, key: str, value: bytes) -> None:
+        try:
+            if len(value) > self.__max_size:
+                return None
+            previous: None | bytes = self.__entries.pop(key, None)
+            if previous is not None:
+                self.__size -= len(previous)
+            self.__entries[key] = value
+            self.__size += len(value)
+            while self.__size > self.__max_size:
+                _, evicted = self.__entries.popitem(last=False)
+                self.__size -= len(evicted)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _put_dir(self, key: str, value: bytes) -> None:
+        try:
+            if len(value) > self.__max_dir_size:
+                return None
+            path: Path = Path(self.__dir).joinpath(f"{key}.pickle")
+            if path.exists():
+                self.__dir_size -= path.stat().st_size
+            tmp_path: Path = Path(self.__dir).joinpath(f"{key}.{os.getpid()}.tmp")
+            tmp_path.write_bytes(value)
+            tmp_path.replace(path)
+            self.__dir_size += len(value)
+            if self.__dir_size <= self.__max_dir_size:
+                return None
+            paths: list[Path] = sorted(Path(self.__dir).glob('*.pickle'), key=lambda v: v.stat().st_mtime)
+            for evicted in paths:
+                if self.__dir_size <= self.__max_dir_size:
+                    break
+                if evicted == path:
+                    continue
+                self.__dir_size -= evicted.stat().st_size
+                evicted.unlink(missing_ok=True)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
@@ -0,0 +1,28 @@
+from collections.abc import Iterable
+from collections.abc import Iterator
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleChunkReader:
+    """
+    ExampleChunkReader class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __chunks: None | Iterator[bytes | memoryview] = None
+
+    def __init__(self, chunks: None | Iterable[bytes | memoryview] | object) -> None:
+        try:
+            if chunks is None:
+                raise Exception("'chunks' is none")
+
+            self.__chunks = iter(chunks)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def read(self, size: int = -1) -> bytes | memoryview:
+        # a reader returns whole chunks whatever size is asked for, a chunk is passed on without a copy
+        for chunk in self.__chunks:
+            if len(chunk):
+                return chunk
+        return b''
@@ -0,0 +1,128 @@
+import json
+import pickle
+import socket
+import struct
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from pathlib import Path
+
+from exqudens.example.example_codec import ExampleCodec
+
+class ExampleClient:
+    """
+    ExampleClient class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    # frame: header length, body length, json header, body
+    __frame: struct.Struct = struct.Struct('>IQ')
+    __path: None | str = None
+    __timeout: None | float = None
+    __socket: None | socket.socket = None
+
+    def __init__(self, path: None | str | object, timeout: None | float | object = None) -> None:
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            if timeout is not None and (not isinstance(timeout, (int, float)) or timeout <= 0):
+                raise Exception("'timeout' is not a positive number")
+
+            self.__path = str(path)
+            self.__timeout = timeout
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def __enter__(self) -> 'ExampleClient':
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def xml_to_dict(self, source: None | str | bytes | object) -> dict[str, object]:
+        try:
+            if source is None:
+                return dict()
+            if isinstance(source, str):
+                source = source.encode()
+            return self._request({'op': 'xml_to_dict'}, source)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def xml_file_to_dict(self, path: None | str | object) -> dict[str, object]:
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            # the server has its own working directory, a relative path is resolved here
+            return self._request({'op': 'xml_file_to_dict', 'path': Path(str(path)).resolve().as_posix()})
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def stats(self) -> dict[str, int]:
+        try:
+            return self._request({'op': 'stats'})
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def close(self) -> None:
+        try:
+            if self.__socket is not None:
+                self.__socket.close()
+                self.__socket = None
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _request(self, header: dict[str, object], body: bytes = b'') -> object:
+        if self.__socket is None:
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.settimeout(self.__timeout)
+            self.__socket.connect(self.__path)
+        try:
+            self._send(self.__socket, header, body)
+            response, body = self._recv(self.__socket)
+            if response is None:
+                raise ConnectionError("connection closed by the server")
+        except Exception:
+            # the connection state is unknown after a partial frame, the next request reconnects
+            self.close()
+            raise
+        if response['ok']:
+            return ExampleCodec.decode(body)
+        if body:
+            raise pickle.loads(body)
+        raise Exception(response['error'])
+
+    @classmethod
+    def _send(cls, connection: socket.socket, header: dict[str, object], body: bytes | memoryview = b'') -> None:
+        data: bytes = json.dumps(header).encode()
+        connection.sendall(b''.join([cls.__frame.pack(len(data), len(body)), data, body]))
+
+    @classmethod
+    def _recv(cls, connection: socket.socket) -> tuple[None | dict[str, object], bytes | memoryview]:
+        frame: None | bytes = cls._recv_exactly(connection, cls.__frame.size)
+        if frame is None:
+            return None, b''
+        header_size, body_size = cls.__frame.unpack(frame)
+        data: None | bytearray = cls._recv_exactly(connection, header_size + body_size)
+        if data is None:
+            raise ConnectionError("connection closed inside a frame")
+        # the body is a view of the received buffer, large payloads are not copied again
+        view: memoryview = memoryview(data)
+        return json.loads(bytes(view[:header_size])), view[header_size:]
+
+    @classmethod
+    def _recv_exactly(cls, connection: socket.socket, size: int) -> None | bytearray:
+        buffer: bytearray = bytearray(size)
+        view: memoryview = memoryview(buffer)
+        received: int = 0
+        while received < size:
+            count: int = connection.recv_into(view[received:])
+            if not count:
+                if received:
+                    raise ConnectionError("connection closed inside a frame")
+                return None
+            received += count
+        return buffer
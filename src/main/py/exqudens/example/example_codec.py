@@ -0,0 +1,90 @@
+import marshal
+import struct
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleCodec:
+    """
+    ExampleCodec class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    # header: magic, format, format version
+    __header: struct.Struct = struct.Struct('<4sBBxx')
+    __magic: bytes = b'EXD\x00'
+    __marshal: int = 1
+    __pickle: int = 2
+
+    @classmethod
+    def encode(cls, value: object) -> bytes:
+        try:
+            header, body = cls._encode(value)
+            return header + body
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def decode(cls, data: bytes | bytearray | memoryview) -> object:
+        try:
+            with memoryview(data) as view:
+                return cls._decode(view)
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def dump_shared(cls, value: object, name: None | str = None) -> object:
+        from multiprocessing.shared_memory import SharedMemory
+
+        try:
+            header, body = cls._encode(value)
+            shared_memory: SharedMemory = SharedMemory(name=name, create=True, size=len(header) + len(body))
+            shared_memory.buf[:len(header)] = header
+            shared_memory.buf[len(header):len(header) + len(body)] = body
+            return shared_memory
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def load_shared(cls, shared_memory: str | object) -> object:
+        from multiprocessing.shared_memory import SharedMemory
+
+        try:
+            if not isinstance(shared_memory, str):
+                return cls._decode(shared_memory.buf)
+            attached: SharedMemory = SharedMemory(name=shared_memory)
+            try:
+                return cls._decode(attached.buf)
+            finally:
+                attached.close()
+        except Exception as e:
+            cls.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _encode(cls, value: object) -> tuple[bytes, bytes]:
+        try:
+            # repeated key objects are written once and referenced after, values are packed by type
+            body: bytes = marshal.dumps(value, marshal.version)
+            return cls.__header.pack(cls.__magic, cls.__marshal, marshal.version), body
+        except ValueError:
+            import pickle
+
+            # schema conversions may produce values marshal does not support, such as 'datetime'
+            return cls.__header.pack(cls.__magic, cls.__pickle, pickle.HIGHEST_PROTOCOL), pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def _decode(cls, view: memoryview) -> object:
+        magic, fmt, version = cls.__header.unpack_from(view)
+        if magic != cls.__magic:
+            raise ValueError(f"not an encoded document: {bytes(magic)!r}")
+        # the body is read in place, a shared memory segment is not copied into this process
+        with view[cls.__header.size:] as body:
+            if fmt == cls.__marshal and version == marshal.version:
+                return marshal.loads(body)
+            if fmt == cls.__pickle:
+                import pickle
+
+                return pickle.loads(body)
+        raise ValueError(f"unsupported format: {fmt} version: {version}")
@@ -0,0 +1,129 @@
+import math
+from array import array
+from collections.abc import Callable
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleColumns:
+    """
+    ExampleColumns class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    # type: (array typecode, numpy dtype name), strings are kept in lists
+    __types: dict[str, tuple[None | str, str]] = {
+        'int': ('q', 'int64'),
+        'float': ('d', 'float64'),
+        'bool': ('b', 'bool'),
+        'str': (None, 'object')
+    }
+    __fields: None | list[str] = None
+    __names: None | list[str] = None
+    __converters: None | list[Callable[[None | str], object]] = None
+    __columns: None | list[array | list[object]] = None
+    __numpy: bool = False
+    __size: int = 0
+
+    def __init__(
+        self,
+        fields: None | list[str] | object,
+        types: None | dict[str, object] | object = None,
+        numpy: None | bool | object = None
+    ) -> None:
+        try:
+            if fields is None:
+                raise Exception("'fields' is none")
+            fields = [fields] if isinstance(fields, str) else list(fields)
+            if not fields:
+                raise Exception("'fields' is empty")
+            if len(set(fields)) != len(fields):
+                raise Exception(f"'fields' has duplicates: {fields}")
+            types = dict(types or {})
+            for field in types:
+                if field not in fields:
+                    raise Exception(f"'types' field is not in 'fields': '{field}'")
+            if numpy is None:
+                numpy = self.available()
+            if numpy and not self.available():
+                raise Exception("'numpy' is not installed")
+
+            names: list[str] = []
+            for field in fields:
+                value: object = types.get(field, 'str')
+                name: None | str = {int: 'int', float: 'float', bool: 'bool', str: 'str'}.get(value, value) if not isinstance(value, str) else value
+                if name not in self.__types:
+                    raise Exception(f"type is not supported: '{field}' {value!r}")
+                names.append(name)
+
+            self.__fields = fields
+            self.__names = names
+            self.__converters = [self._converter(field, name) for field, name in zip(fields, names)]
+            self.__columns = [[] if self.__types[name][0] is None else array(self.__types[name][0]) for name in names]
+            self.__numpy = bool(numpy)
+            self.__size = 0
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            import numpy
+            return True
+        except ImportError:
+            return False
+
+    @property
+    def fields(self) -> list[str]:
+        return list(self.__fields)
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def append(self, row: list[None | str]) -> None:
+        # array columns grow geometrically in place, no per value objects are kept
+        for column, converter, value in zip(self.__columns, self.__converters, row):
+            column.append(converter(value))
+        self.__size += 1
+
+    def to_dict(self) -> dict[str, object]:
+        try:
+            if not self.__numpy:
+                return dict(zip(self.__fields, self.__columns))
+            import numpy
+
+            result: dict[str, object] = {}
+            for field, name, column in zip(self.__fields, self.__names, self.__columns):
+                if isinstance(column, array):
+                    # the array buffer becomes the numpy array memory without a copy
+                    result[field] = numpy.frombuffer(column, dtype=self.__types[name][1])
+                else:
+                    values: object = numpy.empty(len(column), dtype=object)
+                    values[:] = column
+                    result[field] = values
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _converter(self, field: str, name: str) -> Callable[[None | str], object]:
+        if name == 'str':
+            return lambda value: value
+        if name == 'float':
+            return lambda value: math.nan if value is None else float(value)
+        convert: Callable[[str], object] = int if name == 'int' else self._to_bool
+
+        def converter(value: None | str) -> object:
+            if value is None:
+                raise ValueError(f"'{field}' value is missing in row {self.__size}")
+            return convert(value)
+
+        return converter
+
+    @classmethod
+    def _to_bool(cls, value: str) -> bool:
+        if value in ('true', '1'):
+            return True
+        if value in ('false', '0'):
+            return False
+        raise ValueError(f"not a boolean: {value!r}")
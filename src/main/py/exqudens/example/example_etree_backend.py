@@ -0,0 +1,212 @@
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from itertools import chain
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import ParseError
+from xml.etree.ElementTree import TreeBuilder
+from xml.etree.ElementTree import XMLParser
+from xml.etree.ElementTree import iterparse
+from xml.parsers.expat import ExpatError
+
+from exqudens.example.example_backend import ExampleBackend
+from exqudens.example.example_chunk_reader import ExampleChunkReader
+from exqudens.example.example_intern_pool import ExampleInternPool
+from exqudens.example.example_schema import ExampleSchema
+
+class ExampleEtreeBackend(ExampleBackend):
+    """
+    ExampleEtreeBackend class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __xml_namespace: str = 'http://www.w3.org/XML/1998/namespace'
+    name: str = 'etree'
+
+    def parse(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        encoding: None | str = None,
+        phases: None | dict[str, float] = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> dict[str, object]:
+        try:
+            start: float = 0.0 if phases is None else time.perf_counter()
+            declarations: dict[Element, list[tuple[str, str]]] = {}
+            pending: list[tuple[str, str]] = []
+            namespaces: bool = False
+            prefixes: dict[str, str] = {}
+            ambiguous: bool = False
+            root: None | Element = None
+            # a one shot iterator is recorded, the chunks are kept by reference to be parsed again on a fallback
+            replay: None | list[bytes | memoryview] = [] if iter(chunks) is chunks else None
+            source: ExampleChunkReader = ExampleChunkReader(self._record(self._guard(chunks, encoding), replay))
+            parser: None | XMLParser = None if encoding is None else XMLParser(target=TreeBuilder(), encoding=encoding)
+            for event, value in iterparse(source, events=('start-ns', 'start'), parser=parser):
+                if event == 'start-ns':
+                    pending.append(value)
+                    namespaces = True
+                    # etree expands names, the prefix an element used is lost once a uri has two prefixes
+                    if prefixes.setdefault(value[1], value[0]) != value[0]:
+                        ambiguous = True
+                        break
+                    continue
+                if root is None:
+                    root = value
+                if pending:
+                    # declarations and attributes are reported apart, their order in the start tag is lost
+                    if value.attrib:
+                        ambiguous = True
+                        break
+                    declarations[value] = pending
+                    pending = []
+            if ambiguous:
+                return self._fallback(chunks, replay, encoding, phases, schema, pool)
+            if phases is None:
+                return self._convert(root, declarations if namespaces else None, schema, pool)
+            built: float = time.perf_counter()
+            phases['parse'] = built - start
+            result: dict[str, object] = self._convert(root, declarations if namespaces else None, schema, pool)
+            phases['build'] = time.perf_counter() - built
+            return result
+        except ParseError as e:
+            self.__logger.info(e, exc_info=True)
+            raise self._expat_error(str(e), e.code, *e.position) from e
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _record(self, chunks: Iterable[bytes | memoryview], replay: None | list[bytes | memoryview]) -> Iterator[bytes | memoryview]:
+        for chunk in chunks:
+            if replay is not None:
+                replay.append(chunk)
+            yield chunk
+
+    def _fallback(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        replay: None | list[bytes | memoryview],
+        encoding: None | str,
+        phases: None | dict[str, float],
+        schema: None | ExampleSchema,
+        pool: None | ExampleInternPool
+    ) -> dict[str, object]:
+        from exqudens.example.example_xmltodict_backend import ExampleXmltodictBackend
+
+        # the document is parsed again without namespace expansion, prefixes and attribute order stay as written
+        self.__logger.debug("namespace prefixes are ambiguous, parsed by 'xmltodict'")
+        source: Iterable[bytes | memoryview] = chunks if replay is None else chain(replay, chunks)
+        return ExampleXmltodictBackend().parse(source, encoding=encoding, phases=phases, schema=schema, pool=pool)
+
+    def _expat_error(self, message: str, code: None | int, lineno: int, offset: int) -> ExpatError:
+        # malformed input fails with the same error type whichever backend is used
+        error: ExpatError = ExpatError(message)
+        error.code = code
+        error.lineno = lineno
+        error.offset = offset
+        return error
+
+    def _convert(
+        self,
+        root: Element,
+        declarations: None | dict[Element, list[tuple[str, str]]],
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> dict[str, object]:
+        result: dict[str, object] = {}
+        scope: dict[str, str] = {self.__xml_namespace: 'xml'}
+        # frame: [element, item, key, children, text parts, parent item, scope, schema node]
+        frames: list[list[object]] = []
+        # without namespace declarations a name maps to one key, keys are built and interned once per name
+        names: None | dict[str, str] = {} if declarations is None else None
+        state: tuple[object, ...] = (declarations, frames, schema, pool, None if pool is None else pool.values, names, {} if names is not None else None)
+        self._open(root, result, scope, None if schema is None else schema.trie, state)
+        while frames:
+            frame: list[object] = frames[-1]
+            child: None | Element = next(frame[3], None)
+            if child is not None:
+                if child.tail:
+                    frame[4].append(child.tail)
+                self._open(child, frame[1], frame[6], frame[7], state)
+                continue
+            frames.pop()
+            item: dict[str, object] = frame[1]
+            node: None | dict[str, object] = frame[7]
+            text: str = ''.join(frame[4]).strip()
+            if text:
+                if pool is not None:
+                    text = state[4].get(text) or pool.intern(text)
+                item['#text'] = text if node is None or node['type'] is None else schema.convert(node, node['type'], text)
+            self._push(frame[5], frame[2], item, node is not None and node['list'])
+        return result
+
+    def _open(
+        self,
+        element: Element,
+        parent: dict[str, object],
+        scope: dict[str, str],
+        parent_node: None | dict[str, object],
+        state: tuple[object, ...]
+    ) -> None:
+        declarations, frames, schema, pool, values, names, attribute_names = state
+        item: dict[str, object] = {}
+        declared: None | list[tuple[str, str]] = self._declared(element, declarations)
+        if declared:
+            scope = dict(scope)
+            for prefix, uri in declared:
+                scope[uri] = prefix
+                item['@xmlns:' + prefix if prefix else '@xmlns'] = uri
+        key: None | str = None if names is None else names.get(element.tag)
+        if key is None:
+            key = self._name(element.tag, scope, True)
+            if pool is not None:
+                key = pool.intern(key)
+            if names is not None:
+                names[element.tag] = key
+        node: None | dict[str, object] = None if parent_node is None else parent_node['children'].get(key)
+        if not item and not element.attrib and not len(element):
+            value: None | object = element.text.strip() or None if element.text else None
+            if pool is not None and value is not None:
+                value = values.get(value) or pool.intern(value)
+            if node is None:
+                self._push(parent, key, value)
+            else:
+                self._push(parent, key, value if node['type'] is None else schema.convert(node, node['type'], value), node['list'])
+            return
+        for name, value in element.attrib.items():
+            attribute: None | str = None if attribute_names is None else attribute_names.get(name)
+            if attribute is None:
+                attribute = '@' + self._name(name, scope, False)
+                if pool is not None:
+                    attribute = pool.intern(attribute)
+                if attribute_names is not None:
+                    attribute_names[name] = attribute
+            if pool is not None:
+                value = values.get(value) or pool.intern(value)
+            if node is None or attribute[1:] not in node['attributes']:
+                item[attribute] = value
+            else:
+                item[attribute] = schema.convert(node, node['attributes'][attribute[1:]], value, attribute[1:])
+        frames.append([element, item, key, iter(element), [element.text] if element.text else [], parent, scope, node])
+
+    def _declared(
+        self,
+        element: Element,
+        declarations: None | dict[Element, list[tuple[str, str]]]
+    ) -> None | list[tuple[str, str]]:
+        if declarations is None:
+            return None
+        return declarations.get(element)
+
+    def _name(self, name: str, scope: dict[str, str], element: bool) -> str:
+        if name[0] != '{':
+            return name
+        uri, local = name[1:].split('}', 1)
+        prefix: None | str = scope.get(uri)
+        if prefix is None:
+            raise Exception(f"undeclared namespace: '{uri}'")
+        if not prefix and element:
+            return local
+        return prefix + ':' + local
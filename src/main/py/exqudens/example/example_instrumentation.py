@@ -0,0 +1,111 @@
+import time
+import cProfile
+import tracemalloc
+from collections.abc import Callable
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from pathlib import Path
+from threading import Lock
+
+from exqudens.example.example_stats import ExampleStats
+
+class ExampleInstrumentation:
+    """
+    ExampleInstrumentation class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __callback: None | Callable[[ExampleStats], object] = None
+    __profile: bool = False
+    __trace_memory: bool = False
+    __dir: None | str = None
+    __lock: None | object = None
+    __last: None | ExampleStats = None
+    __calls: int = 0
+    __seconds: float = 0.0
+    __bytes_in: int = 0
+    __elements: int = 0
+    __max_depth: int = 0
+
+    def __init__(
+        self,
+        callback: None | Callable[[ExampleStats], object] | object = None,
+        profile: bool = False,
+        trace_memory: bool = False,
+        dir: None | str | object = None
+    ) -> None:
+        try:
+            if callback is not None and not callable(callback):
+                raise Exception("'callback' is not callable")
+
+            self.__callback = callback
+            self.__profile = profile
+            self.__trace_memory = trace_memory
+            self.__dir = Path('build', 'profile').absolute().as_posix() if dir is None else Path(str(dir)).as_posix()
+            self.__lock = Lock()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @property
+    def last(self) -> None | ExampleStats:
+        return self.__last
+
+    def stats(self) -> dict[str, object]:
+        try:
+            with self.__lock:
+                return {
+                    'calls': self.__calls,
+                    'seconds': self.__seconds,
+                    'bytes_in': self.__bytes_in,
+                    'elements': self.__elements,
+                    'max_depth': self.__max_depth
+                }
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def run(self, method: str, function: Callable[..., object], *args: object) -> object:
+        try:
+            stats: ExampleStats = ExampleStats(method)
+            profiler: None | cProfile.Profile = cProfile.Profile() if self.__profile else None
+            tracing: bool = self.__trace_memory and not tracemalloc.is_tracing()
+            if tracing:
+                tracemalloc.start()
+            if profiler is not None:
+                profiler.enable()
+            start: float = time.perf_counter()
+            try:
+                result: object = function(*args, stats)
+            finally:
+                stats.seconds = time.perf_counter() - start
+                if profiler is not None:
+                    profiler.disable()
+                if tracing:
+                    stats.peak_kb = tracemalloc.get_traced_memory()[1] // 1024
+                    snapshot: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+                    tracemalloc.stop()
+
+            # counting walks the result after the clock is stopped, it is not part of the reported timings
+            stats.count(result)
+            with self.__lock:
+                self.__calls += 1
+                number: int = self.__calls
+                self.__seconds += stats.seconds
+                self.__bytes_in += stats.bytes_in
+                self.__elements += stats.elements
+                self.__max_depth = max(self.__max_depth, stats.max_depth)
+                self.__last = stats
+            if profiler is not None or tracing:
+                Path(self.__dir).mkdir(parents=True, exist_ok=True)
+            if profiler is not None:
+                stats.profile_file = Path(self.__dir).joinpath(f"{method}-{number}.prof").as_posix()
+                profiler.dump_stats(stats.profile_file)
+            if tracing:
+                stats.trace_file = Path(self.__dir).joinpath(f"{method}-{number}.trace").as_posix()
+                snapshot.dump(stats.trace_file)
+            if self.__callback is not None:
+                self.__callback(stats)
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
@@ -0,0 +1,65 @@
+import sys
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleInternPool:
+    """
+    ExampleInternPool class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __max_size: int = 64 * 1024
+    __max_length: int = 64
+    __values: None | dict[str, str] = None
+
+    def __init__(
+        self,
+        max_size: None | int | object = None,
+        max_length: None | int | object = None
+    ) -> None:
+        try:
+            if max_size is None:
+                max_size = self.__max_size
+            if not isinstance(max_size, int) or max_size < 0:
+                raise Exception("'max_size' is not a non negative 'int'")
+            if max_length is None:
+                max_length = self.__max_length
+            if not isinstance(max_length, int) or max_length < 0:
+                raise Exception("'max_length' is not a non negative 'int'")
+
+            self.__max_size = max_size
+            self.__max_length = max_length
+            self.__values = {}
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @property
+    def values(self) -> dict[str, str]:
+        # hot loops look values up here directly and only call 'intern' on a miss
+        return self.__values
+
+    def intern(self, value: str) -> str:
+        found: None | str = self.__values.get(value)
+        if found is not None:
+            return found
+        if len(value) <= self.__max_length and len(self.__values) < self.__max_size:
+            self.__values[value] = value
+        return value
+
+    def stats(self) -> dict[str, int]:
+        try:
+            values: list[str] = list(self.__values)
+            return {
+                'entries': len(values),
+                'size': sum(sys.getsizeof(v) for v in values)
+            }
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def clear(self) -> None:
+        try:
+            self.__values.clear()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
@@ -0,0 +1,273 @@
+import re
+from collections.abc import Iterator
+from collections.abc import Mapping
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from mmap import mmap
+
+import xmltodict
+
+from exqudens.example.example_backend import ExampleBackend
+
+class ExampleLazyDict(Mapping):
+    """
+    ExampleLazyDict class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __buffer: None | bytes | mmap = None
+    __start: int = 0
+    __end: int = 0
+    __encoding: None | str = None
+    __element: bool = True
+    __items: None | dict[str, object] = None
+    __safe: None | bool = None
+    __tag_pattern: re.Pattern = re.compile(rb'<([^\s/>]+)(?:[^>"\']|"[^"]*"|\'[^\']*\')*>')
+    __decl_pattern: re.Pattern = re.compile(rb'<\?xml[^>]*?encoding\s*=\s*["\']([^"\']+)["\']')
+    __tag_name_ends: bytes = b' \t\r\n/>'
+    __byte_encodings: list[str] = ['utf-8', 'utf8', 'us-ascii', 'ascii', 'iso-8859-1', 'latin-1', 'latin1']
+    __unsafe_markup: list[bytes] = [b'<!--', b'<![CDATA[', b'<!DOCTYPE', b'<?']
+
+    def __init__(
+        self,
+        buffer: bytes | mmap,
+        start: int,
+        end: int,
+        encoding: None | str = None,
+        element: bool = True,
+        safe: None | bool = None
+    ) -> None:
+        try:
+            self.__buffer = buffer
+            self.__start = start
+            self.__end = end
+            self.__encoding = encoding
+            self.__element = element
+            self.__safe = safe
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def __getitem__(self, key: str) -> object:
+        return self._items()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._items())
+
+    def __len__(self) -> int:
+        return len(self._items())
+
+    def __repr__(self) -> str:
+        if self.__items is None:
+            return f"{self.__class__.__name__}(<{self.__end - self.__start} bytes>)"
+        return f"{self.__class__.__name__}({self.__items!r})"
+
+    def to_dict(self) -> dict[str, object]:
+        try:
+            return {key: self._to_value(value) for key, value in self._items().items()}
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _to_value(cls, value: object) -> object:
+        if isinstance(value, ExampleLazyDict):
+            return value.to_dict()
+        if isinstance(value, list):
+            return [cls._to_value(v) for v in value]
+        return value
+
+    def _items(self) -> dict[str, object]:
+        try:
+            if self.__items is None:
+                if self.__safe is None:
+                    self.__safe = self._byte_scan_safe()
+                if self.__safe:
+                    self.__items = self._byte_scan()
+                else:
+                    self.__items = self._scan()
+            return self.__items
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _byte_scan_safe(self) -> bool:
+        try:
+            start: int = self.__start
+            if not self.__element:
+                if self.__buffer[:2] in [b'\xff\xfe', b'\xfe\xff'] or self.__buffer[:1] == b'\x00':
+                    return False
+                if self.__buffer[start:start + 5] == b'<?xml':
+                    match: None | re.Match = self.__decl_pattern.match(self.__buffer[start:self.__buffer.find(b'>', start) + 1])
+                    self.__encoding = match.group(1).decode().lower() if match else None
+                    start = self.__buffer.find(b'>', start) + 1
+            if self.__encoding is not None and self.__encoding.lower() not in self.__byte_encodings:
+                return False
+            return all(self.__buffer.find(v, start, self.__end) < 0 for v in self.__unsafe_markup)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _byte_scan(self) -> dict[str, object]:
+        try:
+            # only the tags of direct children are visited, their content is skipped with 'find'
+            buffer: bytes | mmap = self.__buffer
+            if self.__element:
+                match: re.Match = self.__tag_pattern.match(buffer, self.__start)
+                own_start: bytes = buffer[self.__start:match.end()]
+                own_end: int = buffer.rfind(b'</', self.__start, self.__end)
+                position: int = match.end()
+            else:
+                own_end = self.__end
+                position = self.__start
+                if buffer[position:position + 5] == b'<?xml':
+                    position = buffer.find(b'>', position) + 1
+
+            segments: list[bytes] = []
+            result: dict[str, object] = {}
+            while True:
+                lt: int = buffer.find(b'<', position, own_end)
+                if lt < 0:
+                    segments.append(buffer[position:own_end])
+                    break
+                segments.append(buffer[position:lt])
+                match = self.__tag_pattern.match(buffer, lt)
+                if match is None:
+                    raise Exception(f"not well-formed at byte {lt}")
+                name: bytes = match.group(1)
+                if buffer[match.end() - 2:match.end() - 1] == b'/':
+                    end: int = match.end()
+                    has_elements: bool = False
+                else:
+                    # the document has a single root, its end tag is the last one
+                    close: int = buffer.rfind(b'</', lt, own_end) if not self.__element else self._find_close(name=name, position=match.end())
+                    end = buffer.find(b'>', close) + 1
+                    has_elements = buffer.find(b'<', match.end(), close) >= 0
+                value: None | str | dict[str, object] | ExampleLazyDict = None
+                if has_elements:
+                    value = ExampleLazyDict(buffer, lt, end, encoding=self.__encoding, safe=True)
+                else:
+                    value = next(iter(xmltodict.parse(buffer[lt:end], encoding=self.__encoding).values()))
+                key: str = name.decode(self.__encoding or 'utf-8')
+                if key not in result:
+                    result[key] = value
+                elif isinstance(result[key], list):
+                    result[key].append(value)
+                else:
+                    result[key] = [result[key], value]
+                position = end
+
+            if not self.__element:
+                return result
+            # attributes and text of this element come from its start tag, text segments and end tag
+            own: bytes = b''.join([own_start] + segments + [buffer[own_end:self.__end]])
+            own_value: None | str | dict[str, object] = next(iter(xmltodict.parse(own, encoding=self.__encoding).values()))
+            if isinstance(own_value, dict):
+                text: None | str = own_value.pop('#text', None)
+                own_value.update(result)
+                if text:
+                    own_value['#text'] = text
+                return own_value
+            if own_value:
+                result['#text'] = own_value
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _find_close(self, name: bytes, position: int) -> int:
+        try:
+            buffer: bytes | mmap = self.__buffer
+            open_tag: bytes = b'<' + name
+            close_tag: bytes = b'</' + name
+            depth: int = 1
+            while True:
+                close: int = buffer.find(close_tag, position, self.__end)
+                while close >= 0 and buffer[close + len(close_tag):close + len(close_tag) + 1] not in self.__tag_name_ends:
+                    close = buffer.find(close_tag, close + len(close_tag), self.__end)
+                if close < 0:
+                    raise Exception(f"end tag not found: '{name.decode()}'")
+                nested: int = buffer.find(open_tag, position, close)
+                while nested >= 0 and buffer[nested + len(open_tag):nested + len(open_tag) + 1] not in self.__tag_name_ends:
+                    nested = buffer.find(open_tag, nested + len(open_tag), close)
+                if nested < 0:
+                    depth -= 1
+                    if depth == 0:
+                        return close
+                    position = close + len(close_tag)
+                    continue
+                match: re.Match = self.__tag_pattern.match(buffer, nested)
+                if buffer[match.end() - 2:match.end() - 1] != b'/':
+                    depth += 1
+                position = match.end()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _scan(self) -> dict[str, object]:
+        try:
+            # one pass over this range, only direct children are recorded, deeper levels stay unparsed
+            child_depth: int = 2 if self.__element else 1
+            attributes: list[str] = []
+            data: list[str] = []
+            children: list[list[object]] = []
+            depth: list[int] = [0]
+            encoding: list[None | str] = [self.__encoding]
+
+            def xml_decl(version: str, encoding_name: None | str, standalone: int) -> None:
+                encoding[0] = encoding_name
+
+            def start_element(name: str, attrs: list[str]) -> None:
+                depth[0] += 1
+                if depth[0] == child_depth:
+                    # child: [name, attrs, start, end, has elements, text parts]
+                    children.append([name, attrs, self.__start + parser.CurrentByteIndex, -1, False, []])
+                elif depth[0] == child_depth + 1:
+                    children[-1][4] = True
+                elif depth[0] == 1:
+                    attributes.extend(attrs)
+
+            def end_element(name: str) -> None:
+                if depth[0] == child_depth:
+                    children[-1][3] = self.__buffer.find(b'>', self.__start + parser.CurrentByteIndex, self.__end) + 1
+                depth[0] -= 1
+
+            def characters(value: str) -> None:
+                if depth[0] == child_depth:
+                    children[-1][5].append(value)
+                elif depth[0] == child_depth - 1:
+                    data.append(value)
+
+            parser = ExampleBackend._create_expat_parser(self.__encoding)
+            parser.XmlDeclHandler = xml_decl
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+            parser.CharacterDataHandler = characters
+            with memoryview(self.__buffer) as view:
+                parser.Parse(view[self.__start:self.__end], True)
+
+            result: dict[str, object] = {'@' + k: v for k, v in zip(attributes[0::2], attributes[1::2])}
+            for name, attrs, start, end, has_elements, parts in children:
+                value: None | str | dict[str, object] | ExampleLazyDict = None
+                if has_elements:
+                    value = ExampleLazyDict(self.__buffer, start, end, encoding=encoding[0])
+                else:
+                    text: None | str = ''.join(parts).strip() or None
+                    if attrs:
+                        value = {'@' + k: v for k, v in zip(attrs[0::2], attrs[1::2])}
+                        if text:
+                            value['#text'] = text
+                    else:
+                        value = text
+                if name not in result:
+                    result[name] = value
+                elif isinstance(result[name], list):
+                    result[name].append(value)
+                else:
+                    result[name] = [result[name], value]
+            text: None | str = ''.join(data).strip() or None
+            if text:
+                result['#text'] = text
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
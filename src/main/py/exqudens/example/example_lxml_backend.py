@@ -0,0 +1,90 @@
+import time
+from collections.abc import Iterable
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+from exqudens.example.example_etree_backend import ExampleEtreeBackend
+from exqudens.example.example_intern_pool import ExampleInternPool
+from exqudens.example.example_schema import ExampleSchema
+
+class ExampleLxmlBackend(ExampleEtreeBackend):
+    """
+    ExampleLxmlBackend class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    name: str = 'lxml'
+
+    @classmethod
+    def available(cls) -> bool:
+        try:
+            import lxml.etree
+            return True
+        except ImportError:
+            return False
+
+    def parse(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        encoding: None | str = None,
+        phases: None | dict[str, float] = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> dict[str, object]:
+        from lxml import etree
+
+        try:
+            start: float = 0.0 if phases is None else time.perf_counter()
+            parser: object = etree.XMLParser(
+                encoding=encoding,
+                resolve_entities=False,
+                remove_comments=True,
+                remove_pis=True,
+                huge_tree=True
+            )
+            namespaces: bool = False
+            tail: bytes = b''
+            replay: None | list[bytes | memoryview] = [] if iter(chunks) is chunks else None
+            for chunk in self._record(self._guard(chunks, encoding), replay):
+                if not namespaces:
+                    # only a chunk that is still searched is copied, lxml reads the buffer itself
+                    data: bytes = bytes(chunk)
+                    namespaces = b'xmlns' in tail + data[:5] or b'xmlns' in data
+                    tail = data[-5:]
+                parser.feed(chunk)
+            root: object = parser.close()
+            if namespaces and self._is_ambiguous(root):
+                return self._fallback(chunks, replay, encoding, phases, schema, pool)
+            # lxml keeps the declarations on the tree, they are compared per element instead of collected
+            if phases is None:
+                return self._convert(root, {} if namespaces else None, schema, pool)
+            built: float = time.perf_counter()
+            phases['parse'] = built - start
+            result: dict[str, object] = self._convert(root, {} if namespaces else None, schema, pool)
+            phases['build'] = time.perf_counter() - built
+            return result
+        except etree.XMLSyntaxError as e:
+            self.__logger.info(e, exc_info=True)
+            raise self._expat_error(str(e), e.code, *e.position) from e
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _is_ambiguous(self, root: object) -> bool:
+        # names are resolved by uri, the prefix an element used is lost once a uri has two prefixes,
+        # and the order of declarations and attributes in a start tag is not kept
+        prefixes: dict[str, str] = {}
+        for element in root.iter():
+            declared: list[tuple[str, str]] = self._declared(element, {})
+            if declared and element.attrib:
+                return True
+            for prefix, uri in declared:
+                if prefixes.setdefault(uri, prefix) != prefix:
+                    return True
+        return False
+
+    def _declared(self, element: object, declarations: None | dict[object, list[tuple[str, str]]]) -> None | list[tuple[str, str]]:
+        if declarations is None:
+            return None
+        parent: None | object = element.getparent()
+        inherited: dict[None | str, str] = {} if parent is None else parent.nsmap
+        return [(prefix or '', uri) for prefix, uri in element.nsmap.items() if inherited.get(prefix) != uri]
@@ -0,0 +1,59 @@
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+from exqudens.example.example_tree import ExampleTree
+
+class ExampleNode:
+    """
+    ExampleNode class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __slots__ = ('__tree', '__index')
+
+    def __init__(self, tree: ExampleTree, index: int = 0) -> None:
+        self.__tree: ExampleTree = tree
+        self.__index: int = index
+
+    @property
+    def tag(self) -> str:
+        return self.__tree.tag(self.__index)
+
+    @property
+    def text(self) -> None | str:
+        return self.__tree.text(self.__index)
+
+    @property
+    def attributes(self) -> tuple[tuple[str, str], ...]:
+        return self.__tree.attributes(self.__index)
+
+    @property
+    def children(self) -> tuple['ExampleNode', ...]:
+        return tuple(ExampleNode(self.__tree, v) for v in self.__tree.children(self.__index))
+
+    def to_dict(self) -> dict[str, object]:
+        try:
+            return {self.tag: self._value(self.__tree, self.__index)}
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _value(cls, tree: ExampleTree, index: int) -> None | str | dict[str, object]:
+        children: list[int] = tree.children(index)
+        if not children and not tree.has_attributes(index):
+            return tree.text(index)
+
+        result: dict[str, object] = {'@' + name: value for name, value in tree.attributes(index)}
+        for child in children:
+            tag: str = tree.tag(child)
+            value: None | str | dict[str, object] = cls._value(tree, child)
+            if tag not in result:
+                result[tag] = value
+            elif isinstance(result[tag], list):
+                result[tag].append(value)
+            else:
+                result[tag] = [result[tag], value]
+        text: None | str = tree.text(index)
+        if text:
+            result['#text'] = text
+        return result
@@ -0,0 +1,138 @@
+from collections.abc import Callable
+from datetime import date
+from datetime import datetime
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleSchema:
+    """
+    ExampleSchema class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __types: None | dict[str, object] = None
+    __lists: None | list[str] = None
+    __trie: None | dict[str, object] = None
+    __key: None | str = None
+
+    def __init__(
+        self,
+        types: None | dict[str, object] | object = None,
+        lists: None | list[str] | object = None
+    ) -> None:
+        try:
+            types = dict(types or {})
+            lists = [lists] if isinstance(lists, str) else list(lists or [])
+            if not types and not lists:
+                raise Exception("'types' and 'lists' are empty")
+
+            # trie node: {'children': {name: node}, 'attributes': {name: converter}, 'type': converter, 'list': bool, 'path': str}
+            trie: dict[str, object] = self._create_node('')
+            for path, value in types.items():
+                names: list[str] = self._split(path)
+                converter: Callable[[str], object] = self._converter(path, value)
+                if names[-1].startswith('@'):
+                    if len(names) == 1:
+                        raise Exception(f"attribute is not the last segment of an element path: '{path}'")
+                    self._find_node(trie, names[:-1])['attributes'][names[-1][1:]] = converter
+                else:
+                    self._find_node(trie, names)['type'] = converter
+            for path in lists:
+                names: list[str] = self._split(path)
+                if names[-1].startswith('@') or len(names) == 1:
+                    raise Exception(f"path is not a child element path: '{path}'")
+                self._find_node(trie, names)['list'] = True
+
+            self.__types = types
+            self.__lists = lists
+            self.__trie = trie
+            names: dict[str, None | str] = {k: self._name(v) for k, v in types.items()}
+            # a schema with a converter that has no stable name is not cached
+            self.__key = None if None in names.values() else repr((sorted(names.items()), sorted(lists)))
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @property
+    def types(self) -> dict[str, object]:
+        return dict(self.__types)
+
+    @property
+    def lists(self) -> list[str]:
+        return list(self.__lists)
+
+    @property
+    def trie(self) -> dict[str, object]:
+        return self.__trie
+
+    @property
+    def key(self) -> None | str:
+        return self.__key
+
+    def convert(self, node: dict[str, object], converter: Callable[[str], object], value: object, name: None | str = None) -> object:
+        if not isinstance(value, str):
+            return value
+        try:
+            return converter(value)
+        except Exception as e:
+            path: str = node['path'] if name is None else node['path'] + '/@' + name
+            raise ValueError(f"'{path}' value {value!r} is not convertible by {converter!r}") from e
+
+    def _name(self, value: object) -> None | str:
+        from importlib import import_module
+
+        # the key is reused across processes by the disk cache, only a converter that imports back to itself
+        # has a name that means the same in every process, lambdas and local functions do not
+        if isinstance(value, str):
+            return repr(value)
+        module: None | str = getattr(value, '__module__', None)
+        qualname: None | str = getattr(value, '__qualname__', None)
+        if not module or not qualname or '<' in qualname:
+            return None
+        try:
+            found: object = import_module(module)
+            for name in qualname.split('.'):
+                found = getattr(found, name)
+        except (ImportError, AttributeError):
+            return None
+        return f"{module}.{qualname}" if found is value else None
+
+    def _split(self, path: object) -> list[str]:
+        if not isinstance(path, str):
+            raise Exception(f"path is not an instance of 'str': {path!r}")
+        names: list[str] = [v for v in path.split('/') if v]
+        if not names:
+            raise Exception(f"path is empty: '{path}'")
+        for name in names[:-1]:
+            if name.startswith('@'):
+                raise Exception(f"attribute is not the last segment of an element path: '{path}'")
+        return names
+
+    def _find_node(self, trie: dict[str, object], names: list[str]) -> dict[str, object]:
+        node: dict[str, object] = trie
+        for name in names:
+            node = node['children'].setdefault(name, self._create_node('/'.join([node['path'], name]) if node['path'] else name))
+        return node
+
+    def _create_node(self, path: str) -> dict[str, object]:
+        return {'children': {}, 'attributes': {}, 'type': None, 'list': False, 'path': path}
+
+    def _converter(self, path: str, value: object) -> Callable[[str], object]:
+        if value in (bool, 'bool'):
+            return self._to_bool
+        if value in (datetime, 'datetime'):
+            return datetime.fromisoformat
+        if value in (date, 'date'):
+            return date.fromisoformat
+        if isinstance(value, str):
+            value = {'int': int, 'float': float, 'str': str}.get(value, value)
+        if not callable(value):
+            raise Exception(f"type is not supported: '{path}' {value!r}")
+        return value
+
+    @classmethod
+    def _to_bool(cls, value: str) -> bool:
+        if value in ('true', '1'):
+            return True
+        if value in ('false', '0'):
+            return False
+        raise ValueError(f"not a boolean: {value!r}")
@@ -0,0 +1,56 @@
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleSelector:
+    """
+    ExampleSelector class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __paths: None | list[str] = None
+    __trie: None | dict[str, object] = None
+
+    def __init__(self, paths: None | list[str] | object) -> None:
+        try:
+            if paths is None:
+                raise Exception("'paths' is none")
+            if isinstance(paths, str):
+                paths = [paths]
+            paths = list(paths)
+            if not paths:
+                raise Exception("'paths' is empty")
+
+            # trie node: {'children': {name: node}, 'attributes': {name}, 'selected': bool}
+            trie: dict[str, object] = self._create_node()
+            for path in paths:
+                if not isinstance(path, str):
+                    raise Exception(f"path is not an instance of 'str': {path!r}")
+                names: list[str] = [v for v in path.split('/') if v]
+                if not names:
+                    raise Exception(f"path is empty: '{path}'")
+                node: dict[str, object] = trie
+                for i, name in enumerate(names):
+                    if name.startswith('@'):
+                        if i != len(names) - 1 or i == 0:
+                            raise Exception(f"attribute is not the last segment of an element path: '{path}'")
+                        node['attributes'].add(name[1:])
+                        break
+                    node = node['children'].setdefault(name, self._create_node())
+                else:
+                    node['selected'] = True
+
+            self.__paths = paths
+            self.__trie = trie
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    @property
+    def paths(self) -> list[str]:
+        return list(self.__paths)
+
+    @property
+    def trie(self) -> dict[str, object]:
+        return self.__trie
+
+    def _create_node(self) -> dict[str, object]:
+        return {'children': {}, 'attributes': set(), 'selected': False}
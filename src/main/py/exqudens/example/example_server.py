@@ -0,0 +1,319 @@
+import os
+import sys
+import pickle
+import socket
+import logging
+import resource
+import time
+import multiprocessing
+from argparse import ArgumentParser
+from argparse import Namespace
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from multiprocessing.connection import Connection
+from pathlib import Path
+from queue import Empty
+from queue import Queue
+from threading import Lock
+from threading import Thread
+
+from exqudens.example.example_client import ExampleClient
+from exqudens.example.example_codec import ExampleCodec
+
+class ExampleServer:
+    """
+    ExampleServer class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __path: None | str = None
+    __workers: int = 0
+    __max_jobs: None | int = None
+    __max_rss_kb: None | int = None
+    __job_timeout: None | float = None
+    __backend: None | str = None
+    __interning: bool = False
+    __context: None | object = None
+    __idle: None | Queue[dict[str, object]] = None
+    __busy: None | list[dict[str, object]] = None
+    __close_timeout: float = 10.0
+    __socket: None | socket.socket = None
+    __thread: None | Thread = None
+    __lock: None | object = None
+    __closed: bool = False
+    __jobs: int = 0
+    __failures: int = 0
+    __recycled: int = 0
+
+    def __init__(
+        self,
+        path: None | str | object,
+        workers: None | int | object = None,
+        max_jobs: None | int | object = None,
+        max_rss_kb: None | int | object = None,
+        job_timeout: None | float | object = None,
+        backend: None | str | object = None,
+        interning: None | bool | object = None
+    ) -> None:
+        try:
+            if path is None:
+                raise Exception("'path' is none")
+            if workers is None:
+                workers = os.cpu_count() or 1
+            if not isinstance(workers, int) or workers <= 0:
+                raise Exception("'workers' is not a positive 'int'")
+            if max_jobs is not None and (not isinstance(max_jobs, int) or max_jobs <= 0):
+                raise Exception("'max_jobs' is not a positive 'int'")
+            if max_rss_kb is not None and (not isinstance(max_rss_kb, int) or max_rss_kb <= 0):
+                raise Exception("'max_rss_kb' is not a positive 'int'")
+            if job_timeout is not None and (not isinstance(job_timeout, (int, float)) or job_timeout <= 0):
+                raise Exception("'job_timeout' is not a positive number")
+            if backend is not None and not isinstance(backend, str):
+                raise Exception("'backend' is not an instance of 'str'")
+
+            self.__path = str(path)
+            self.__workers = workers
+            self.__max_jobs = max_jobs
+            self.__max_rss_kb = max_rss_kb
+            self.__job_timeout = job_timeout
+            self.__backend = backend
+            self.__interning = bool(interning)
+            # workers are spawned, a forked child would inherit the locks held by the connection threads
+            self.__context = multiprocessing.get_context('spawn')
+            self.__idle = Queue()
+            self.__busy = []
+            self.__lock = Lock()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def __enter__(self) -> 'ExampleServer':
+        self.start()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def start(self) -> None:
+        try:
+            if self.__socket is not None:
+                raise Exception("server is already started")
+            for _ in range(self.__workers):
+                self.__idle.put(self._spawn())
+            Path(self.__path).unlink(missing_ok=True)
+            self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self.__socket.bind(self.__path)
+            # errors are pickled, only the owner may connect
+            os.chmod(self.__path, 0o600)
+            self.__socket.listen()
+            self.__thread = Thread(target=self._accept, name='example-server', daemon=True)
+            self.__thread.start()
+            self.__logger.info(f"listening: '{self.__path}' workers: {self.__workers}")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def serve_forever(self) -> None:
+        try:
+            if self.__socket is None:
+                self.start()
+            self.__thread.join()
+        except KeyboardInterrupt:
+            self.close()
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def stats(self) -> dict[str, int]:
+        try:
+            with self.__lock:
+                return {
+                    'workers': self.__workers,
+                    'jobs': self.__jobs,
+                    'failures': self.__failures,
+                    'recycled': self.__recycled
+                }
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def close(self) -> None:
+        try:
+            if self.__closed:
+                return None
+            self.__closed = True
+            if self.__socket is not None:
+                self.__socket.close()
+                Path(self.__path).unlink(missing_ok=True)
+            # idle workers are stopped as they come back, a worker still busy at the deadline is killed,
+            # a stuck job does not block the shutdown
+            deadline: float = time.monotonic() + self.__close_timeout
+            while True:
+                with self.__lock:
+                    busy: list[dict[str, object]] = list(self.__busy)
+                try:
+                    worker: dict[str, object] = self.__idle.get(timeout=0.1) if busy else self.__idle.get_nowait()
+                except Empty:
+                    if not busy:
+                        break
+                    if time.monotonic() >= deadline:
+                        for worker in busy:
+                            self.__logger.info(f"worker killed on close: pid: {worker['process'].pid}")
+                            worker['process'].kill()
+                        break
+                    continue
+                self._stop(worker)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _accept(self) -> None:
+        while not self.__closed:
+            try:
+                connection, _ = self.__socket.accept()
+            except OSError:
+                return None
+            Thread(target=self._handle, args=(connection,), name='example-server-connection', daemon=True).start()
+
+    def _handle(self, connection: socket.socket) -> None:
+        try:
+            with connection:
+                while True:
+                    header, body = ExampleClient._recv(connection)
+                    if header is None:
+                        return None
+                    op: object = header.get('op')
+                    if op == 'stats':
+                        ExampleClient._send(connection, {'ok': True}, ExampleCodec.encode(self.stats()))
+                    elif op == 'xml_to_dict':
+                        self._reply(connection, self._run(('xml_to_dict', bytes(body))))
+                    elif op == 'xml_file_to_dict':
+                        self._reply(connection, self._run(('xml_file_to_dict', str(header.get('path')))))
+                    else:
+                        ExampleClient._send(connection, {'ok': False, 'error': f"unsupported op: {op!r}"})
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+
+    def _reply(self, connection: socket.socket, response: tuple[bool, bytes | str]) -> None:
+        ok, value = response
+        if isinstance(value, str):
+            ExampleClient._send(connection, {'ok': False, 'error': value})
+        else:
+            ExampleClient._send(connection, {'ok': ok}, value)
+
+    def _run(self, job: tuple[str, object]) -> tuple[bool, bytes | str]:
+        worker: dict[str, object] = self.__idle.get()
+        taken: dict[str, object] = worker
+        with self.__lock:
+            self.__busy.append(taken)
+        try:
+            process: multiprocessing.Process = worker['process']
+            connection: Connection = worker['connection']
+            try:
+                connection.send(job)
+                if not connection.poll(self.__job_timeout):
+                    raise TimeoutError(f"job timed out after {self.__job_timeout} seconds")
+                ok, value, rss_kb = connection.recv()
+            except (EOFError, OSError, TimeoutError) as e:
+                # a crashed or stuck worker is replaced, the error goes to the client instead of the server
+                self.__logger.info(f"worker failed: pid: {process.pid} exitcode: {process.exitcode} error: {e!r}")
+                with self.__lock:
+                    self.__failures += 1
+                self._stop(worker)
+                if not self.__closed:
+                    worker = self._spawn()
+                return False, f"worker failed: {e!r}"
+            worker['jobs'] += 1
+            with self.__lock:
+                self.__jobs += 1
+            if (
+                (self.__max_jobs is not None and worker['jobs'] >= self.__max_jobs)
+                or (self.__max_rss_kb is not None and rss_kb >= self.__max_rss_kb)
+            ):
+                self.__logger.info(f"worker recycled: pid: {process.pid} jobs: {worker['jobs']} rss_kb: {rss_kb}")
+                with self.__lock:
+                    self.__recycled += 1
+                self._stop(worker)
+                worker = self._spawn()
+            return ok, value
+        finally:
+            with self.__lock:
+                self.__busy.remove(taken)
+            if self.__closed:
+                # the shutdown already drained the idle workers, one returned after it is stopped here
+                self._stop(worker)
+            else:
+                self.__idle.put(worker)
+
+    def _spawn(self) -> dict[str, object]:
+        connection, child_connection = self.__context.Pipe()
+        process: multiprocessing.Process = self.__context.Process(
+            target=ExampleServer._work,
+            args=(child_connection, self.__backend, self.__interning),
+            name='example-worker',
+            daemon=True
+        )
+        process.start()
+        child_connection.close()
+        return {'process': process, 'connection': connection, 'jobs': 0}
+
+    def _stop(self, worker: dict[str, object]) -> None:
+        process: multiprocessing.Process = worker['process']
+        connection: Connection = worker['connection']
+        try:
+            connection.send(None)
+        except (OSError, ValueError):
+            pass
+        connection.close()
+        process.join(1)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+    @classmethod
+    def _work(cls, connection: Connection, backend: None | str, interning: bool) -> None:
+        from exqudens.example.example import Example
+
+        # the instance is created once, imports and backend selection are paid before the first job
+        obj: Example = Example(backend=backend, interning=interning or None)
+        while True:
+            try:
+                job: None | tuple[str, object] = connection.recv()
+            except EOFError:
+                return None
+            if job is None:
+                return None
+            op, value = job
+            try:
+                result: dict[str, object] = obj.xml_to_dict(value) if op == 'xml_to_dict' else obj.xml_file_to_dict(value)
+                response: tuple[bool, bytes] = (True, ExampleCodec.encode(result))
+            except Exception as e:
+                try:
+                    response = (False, pickle.dumps(e, pickle.HIGHEST_PROTOCOL))
+                except Exception:
+                    response = (False, pickle.dumps(Exception(f"{e.__class__.__name__}: {e}")))
+            connection.send((*response, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss))
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--path', type=str, required=True, help='unix socket path')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: cpu count)')
+    parser.add_argument('--max-jobs', type=int, default=None, help='jobs after which a worker is replaced')
+    parser.add_argument('--max-rss-kb', type=int, default=None, help='peak rss after which a worker is replaced')
+    parser.add_argument('--job-timeout', type=float, default=None, help='seconds after which a job fails and its worker is replaced')
+    parser.add_argument('--backend', type=str, default=None, help='parser backend (default: auto)')
+    parser.add_argument('--interning', action='store_true', help='intern keys and short values')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    ExampleServer(
+        path=namespace.path,
+        workers=namespace.workers,
+        max_jobs=namespace.max_jobs,
+        max_rss_kb=namespace.max_rss_kb,
+        job_timeout=namespace.job_timeout,
+        backend=namespace.backend,
+        interning=namespace.interning
+    ).serve_forever()
@@ -0,0 +1,64 @@
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+
+class ExampleStats:
+    """
+    ExampleStats class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    method: str = ''
+    seconds: float = 0.0
+    phases: None | dict[str, float] = None
+    bytes_in: int = 0
+    elements: int = 0
+    max_depth: int = 0
+    peak_kb: None | int = None
+    profile_file: None | str = None
+    trace_file: None | str = None
+
+    def __init__(self, method: None | str | object) -> None:
+        try:
+            if method is None:
+                raise Exception("'method' is none")
+            if not isinstance(method, str):
+                raise Exception("'method' is not an instance of 'str'")
+
+            self.method = method
+            self.phases = {}
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def count(self, result: object) -> None:
+        try:
+            elements: int = 0
+            max_depth: int = 0
+            stack: list[tuple[object, int]] = [(v, 1) for v in result.values()] if isinstance(result, dict) else []
+            while stack:
+                value, depth = stack.pop()
+                if isinstance(value, list):
+                    stack.extend((v, depth) for v in value)
+                    continue
+                elements += 1
+                if depth > max_depth:
+                    max_depth = depth
+                if isinstance(value, dict):
+                    stack.extend((v, depth + 1) for k, v in value.items() if k[0] != '@' and k != '#text')
+            self.elements = elements
+            self.max_depth = max_depth
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            'method': self.method,
+            'seconds': self.seconds,
+            'phases': dict(self.phases),
+            'bytes_in': self.bytes_in,
+            'elements': self.elements,
+            'max_depth': self.max_depth,
+            'peak_kb': self.peak_kb,
+            'profile_file': self.profile_file,
+            'trace_file': self.trace_file
+        }
@@ -0,0 +1,135 @@
+from array import array
+from io import StringIO
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from sys import intern as sys_intern
+
+class ExampleTree:
+    """
+    ExampleTree class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __slots__ = (
+        '__names',
+        '__name_ids',
+        '__tags',
+        '__first_children',
+        '__next_siblings',
+        '__text_starts',
+        '__text_ends',
+        '__attribute_starts',
+        '__attribute_names',
+        '__attribute_value_starts',
+        '__attribute_value_ends',
+        '__texts',
+        '__size',
+        '__buffer',
+        '__stack'
+    )
+
+    def __init__(self) -> None:
+        try:
+            self.__names: list[str] = []
+            self.__name_ids: dict[str, int] = {}
+            self.__tags: array = array('I')
+            self.__first_children: array = array('q')
+            self.__next_siblings: array = array('q')
+            self.__text_starts: array = array('Q')
+            self.__text_ends: array = array('Q')
+            self.__attribute_starts: array = array('Q', [0])
+            self.__attribute_names: array = array('I')
+            self.__attribute_value_starts: array = array('Q')
+            self.__attribute_value_ends: array = array('Q')
+            self.__texts: None | StringIO = StringIO()
+            self.__size: int = 0
+            self.__buffer: str = ''
+            self.__stack: list[list[object]] = []
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def start_element(self, name: str, attrs: list[str]) -> None:
+        index: int = len(self.__tags)
+        self.__tags.append(self._name_id(name))
+        self.__first_children.append(-1)
+        self.__next_siblings.append(-1)
+        self.__text_starts.append(0)
+        self.__text_ends.append(0)
+        for i in range(0, len(attrs), 2):
+            self.__attribute_names.append(self._name_id(attrs[i]))
+            start, end = self._append_text(attrs[i + 1])
+            self.__attribute_value_starts.append(start)
+            self.__attribute_value_ends.append(end)
+        self.__attribute_starts.append(len(self.__attribute_names))
+        if self.__stack:
+            parent: list[object] = self.__stack[-1]
+            if parent[1] < 0:
+                self.__first_children[parent[0]] = index
+            else:
+                self.__next_siblings[parent[1]] = index
+            parent[1] = index
+        # open element: [index, last child index, text parts]
+        self.__stack.append([index, -1, []])
+
+    def end_element(self, name: str) -> None:
+        index, _, data = self.__stack.pop()
+        text: str = ''.join(data).strip()
+        if text:
+            start, end = self._append_text(text)
+            self.__text_starts[index] = start
+            self.__text_ends[index] = end
+
+    def characters(self, data: str) -> None:
+        self.__stack[-1][2].append(data)
+
+    def close(self) -> None:
+        try:
+            if self.__stack:
+                raise Exception(f"unclosed elements: {len(self.__stack)}")
+            self.__buffer = self.__texts.getvalue()
+            self.__texts = None
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def size(self) -> int:
+        return len(self.__tags)
+
+    def tag(self, index: int) -> str:
+        return self.__names[self.__tags[index]]
+
+    def text(self, index: int) -> None | str:
+        start: int = self.__text_starts[index]
+        end: int = self.__text_ends[index]
+        return self.__buffer[start:end] if start < end else None
+
+    def attributes(self, index: int) -> tuple[tuple[str, str], ...]:
+        return tuple(
+            (self.__names[self.__attribute_names[i]], self.__buffer[self.__attribute_value_starts[i]:self.__attribute_value_ends[i]])
+            for i in range(self.__attribute_starts[index], self.__attribute_starts[index + 1])
+        )
+
+    def has_attributes(self, index: int) -> bool:
+        return self.__attribute_starts[index] < self.__attribute_starts[index + 1]
+
+    def children(self, index: int) -> list[int]:
+        result: list[int] = []
+        child: int = self.__first_children[index]
+        while child >= 0:
+            result.append(child)
+            child = self.__next_siblings[child]
+        return result
+
+    def _name_id(self, name: str) -> int:
+        name_id: None | int = self.__name_ids.get(name)
+        if name_id is None:
+            name_id = len(self.__names)
+            self.__names.append(sys_intern(name))
+            self.__name_ids[name] = name_id
+        return name_id
+
+    def _append_text(self, text: str) -> tuple[int, int]:
+        start: int = self.__size
+        self.__texts.write(text)
+        self.__size += len(text)
+        return start, self.__size
@@ -0,0 +1,113 @@
+from io import TextIOBase
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from xml.sax.saxutils import escape
+from xml.sax.saxutils import quoteattr
+
+class ExampleXmlWriter:
+    """
+    ExampleXmlWriter class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __output: None | object = None
+    __encoding: str = 'utf-8'
+    __text: bool = True
+    __buffer_size: int = 64 * 1024
+    __parts: None | list[str] = None
+    __size: int = 0
+
+    def __init__(
+        self,
+        output: None | object = None,
+        encoding: None | str = None,
+        buffer_size: None | int | object = None
+    ) -> None:
+        try:
+            if output is not None and not hasattr(output, 'write'):
+                raise Exception("'output' has no 'write' method")
+            if buffer_size is None:
+                buffer_size = self.__buffer_size
+            if not isinstance(buffer_size, int) or buffer_size <= 0:
+                raise Exception("'buffer_size' is not a positive 'int'")
+
+            self.__output = output
+            self.__encoding = encoding or self.__encoding
+            self.__text = output is None or isinstance(output, TextIOBase)
+            self.__buffer_size = buffer_size
+            self.__parts = []
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def declaration(self) -> None:
+        self._write(f'<?xml version="1.0" encoding="{self.__encoding}"?>\n')
+
+    def start(self, name: str, attributes: None | dict[str, object] = None) -> None:
+        if attributes:
+            # like 'unparse' attribute values are not passed through '_to_str', a boolean is written as 'True'
+            self._write('<' + name + ''.join(' ' + k + '=' + quoteattr(v if isinstance(v, str) else str(v)) for k, v in attributes.items()) + '>')
+        else:
+            self._write('<' + name + '>')
+
+    def end(self, name: str) -> None:
+        self._write('</' + name + '>')
+
+    def element(self, name: str, value: object) -> None:
+        if isinstance(value, list):
+            for item in value:
+                self.element(name, item)
+            return
+        if not isinstance(value, dict):
+            self._write('<' + name + '>' + ('' if value is None else escape(self._to_str(value))) + '</' + name + '>')
+            return
+
+        attributes: dict[str, object] = {}
+        children: list[tuple[str, object]] = []
+        text: None | object = None
+        for key, item in value.items():
+            if key == '#text':
+                text = item
+            elif key.startswith('@'):
+                attributes[key[1:]] = item
+            else:
+                children.append((key, item))
+        self.start(name, attributes)
+        for key, item in children:
+            self.element(key, item)
+        if text is not None:
+            self._write(escape(self._to_str(text)))
+        self.end(name)
+
+    def flush(self) -> None:
+        try:
+            if self.__output is None or not self.__parts:
+                return None
+            data: str = ''.join(self.__parts)
+            self.__parts.clear()
+            self.__size = 0
+            self.__output.write(data if self.__text else data.encode(self.__encoding, 'xmlcharrefreplace'))
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def getvalue(self) -> str:
+        try:
+            if self.__output is not None:
+                raise Exception("'output' is set, content is written to it")
+            return ''.join(self.__parts)
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _write(self, data: str) -> None:
+        self.__parts.append(data)
+        self.__size += len(data)
+        if self.__output is not None and self.__size >= self.__buffer_size:
+            self.flush()
+
+    def _to_str(self, value: object) -> str:
+        if isinstance(value, str):
+            return value
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        return str(value)
@@ -0,0 +1,112 @@
+import time
+from collections.abc import Iterable
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from xml.parsers import expat
+
+import xmltodict
+
+from exqudens.example.example_backend import ExampleBackend
+from exqudens.example.example_intern_pool import ExampleInternPool
+from exqudens.example.example_schema import ExampleSchema
+
+class ExampleXmltodictBackend(ExampleBackend):
+    """
+    ExampleXmltodictBackend class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    name: str = 'xmltodict'
+
+    def parse(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        encoding: None | str = None,
+        phases: None | dict[str, float] = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> dict[str, object]:
+        try:
+            if phases is None and schema is None and pool is None:
+                return xmltodict.parse((chunk for chunk in chunks), encoding=encoding)
+            # the dict is built from the parser callbacks, building is part of the 'parse' phase
+            start: float = 0.0 if phases is None else time.perf_counter()
+            if schema is None and pool is None:
+                result: dict[str, object] = xmltodict.parse((chunk for chunk in chunks), encoding=encoding)
+            else:
+                result: dict[str, object] = self._parse_hooked(chunks, encoding, schema, pool)
+            if phases is not None:
+                phases['parse'] = time.perf_counter() - start
+            return result
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def _parse_hooked(
+        self,
+        chunks: Iterable[bytes | memoryview],
+        encoding: None | str,
+        schema: None | ExampleSchema,
+        pool: None | ExampleInternPool
+    ) -> dict[str, object]:
+        handler: xmltodict._DictSAXHandler = xmltodict._DictSAXHandler()
+        parser: expat.XMLParserType = self._create_parser(handler, encoding, schema, pool)
+        for chunk in chunks:
+            parser.Parse(chunk, False)
+        parser.Parse(b'', True)
+        return handler.item
+
+    def _create_parser(
+        self,
+        handler: xmltodict._DictSAXHandler,
+        encoding: None | str = None,
+        schema: None | ExampleSchema = None,
+        pool: None | ExampleInternPool = None
+    ) -> expat.XMLParserType:
+        intern: None | object = None if pool is None else pool.intern
+        values: None | dict[str, str] = None if pool is None else pool.values
+        # schema nodes follow the open elements, the hooks are only installed where there is something to apply
+        nodes: list[None | dict[str, object]] = [None if schema is None else schema.trie]
+
+        def postprocessor(path: list[tuple[str, object]], key: str, value: object) -> tuple[str, object]:
+            if intern is not None:
+                key = values.get(key) or intern(key)
+                if isinstance(value, str):
+                    value = values.get(value) or intern(value)
+            node: None | dict[str, object] = nodes[-1]
+            if node is None:
+                return key, value
+            if key[0] == '@':
+                converter: None | object = node['attributes'].get(key[1:])
+                return key, value if converter is None else schema.convert(node, converter, value, key[1:])
+            if node['type'] is None or isinstance(value, dict):
+                return key, value
+            return key, schema.convert(node, node['type'], value)
+
+        def force_list(path: list[tuple[str, object]], key: str, value: object) -> bool:
+            return key[0] != '#'
+
+        def start_element(name: str, attrs: list[str]) -> None:
+            parent: None | dict[str, object] = nodes[-1]
+            node: None | dict[str, object] = None if parent is None else parent['children'].get(name)
+            nodes.append(node)
+            handler.postprocessor = postprocessor if intern is not None or node is not None and node['attributes'] else None
+            handler.startElement(name, attrs)
+
+        def end_element(name: str) -> None:
+            node: None | dict[str, object] = nodes[-1]
+            handler.postprocessor = postprocessor if intern is not None or node is not None and node['type'] is not None else None
+            handler.force_list = force_list if node is not None and node['list'] else None
+            handler.endElement(name)
+            nodes.pop()
+
+        parser: expat.XMLParserType = self._create_expat_parser(encoding)
+        parser.StartNamespaceDeclHandler = handler.startNamespaceDecl
+        if schema is None:
+            handler.postprocessor = None if pool is None else postprocessor
+            parser.StartElementHandler = handler.startElement
+            parser.EndElementHandler = handler.endElement
+        else:
+            parser.StartElementHandler = start_element
+            parser.EndElementHandler = end_element
+        parser.CharacterDataHandler = handler.characters
+        return parser
@@ -0,0 +1,115 @@
+import gc
+import sys
+import json
+import time
+import pickle
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from collections.abc import Callable
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+sys.path.insert(0, Path(__file__).parent.parent.parent.parent.joinpath('main', 'py').as_posix())
+sys.path.insert(0, Path(__file__).parent.as_posix())
+
+from exqudens.example import Example
+from exqudens.example import ExampleCodec
+
+from bench_xml_to_dict import BenchXmlToDict
+from utils_for_test import UtilsForTest
+
+class BenchCodec:
+    """
+    BenchCodec class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __shapes: list[str] = ['deep', 'wide', 'attributes', 'text', 'namespaces']
+    __runs: int = 5
+
+    @classmethod
+    def run(cls, size: int, runs: None | int = None) -> list[dict[str, object]]:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'codec')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            corpus_dir: Path = Path(project_dir).joinpath('build', 'bench', 'xml_to_dict')
+            corpus_dir.mkdir(parents=True, exist_ok=True)
+            runs = runs or cls.__runs
+
+            formats: dict[str, tuple[Callable[[object], bytes], Callable[[bytes], object]]] = {
+                'pickle': (lambda v: pickle.dumps(v, pickle.HIGHEST_PROTOCOL), pickle.loads),
+                'json': (lambda v: json.dumps(v).encode(), json.loads),
+                'codec': (ExampleCodec.encode, ExampleCodec.decode),
+                'codec_shared': (cls._dump_shared, cls._load_shared)
+            }
+            results: list[dict[str, object]] = []
+            for shape in cls.__shapes:
+                path: Path = corpus_dir.joinpath(f"{shape}-{size}.xml")
+                if not path.exists():
+                    BenchXmlToDict._generate(path=path, shape=shape, size=size)
+                value: dict[str, object] = Example().xml_file_to_dict(path)
+                for name, (encode, decode) in formats.items():
+                    encode_seconds, data = cls._best(runs, encode, value)
+                    decode_seconds, decoded = cls._best(runs, decode, data)
+                    if decoded != value:
+                        raise Exception(f"'{name}' round trip mismatch: '{shape}'")
+                    result: dict[str, object] = {
+                        'shape': shape,
+                        'size': size,
+                        'format': name,
+                        'encode_seconds': encode_seconds,
+                        'decode_seconds': decode_seconds,
+                        'bytes': len(data) if isinstance(data, bytes) else data.size
+                    }
+                    if name == 'codec_shared':
+                        data.close()
+                        data.unlink()
+                    cls.__logger.info(
+                        f"shape: {shape} format: {name}"
+                        f" encode_ms: {1000 * encode_seconds:.1f} decode_ms: {1000 * decode_seconds:.1f}"
+                        f" kb: {result['bytes'] // 1024}"
+                    )
+                    results.append(result)
+            out_dir.joinpath('results.json').write_bytes(json.dumps(results, indent=2).encode())
+            return results
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _best(cls, runs: int, function: Callable[[object], object], value: object) -> tuple[float, object]:
+        seconds: list[float] = []
+        result: object = None
+        gc.collect()
+        gc.disable()
+        try:
+            for _ in range(runs):
+                if result is not None and hasattr(result, 'unlink'):
+                    result.close()
+                    result.unlink()
+                start: float = time.perf_counter()
+                result = function(value)
+                seconds.append(time.perf_counter() - start)
+        finally:
+            gc.enable()
+        return min(seconds), result
+
+    @classmethod
+    def _dump_shared(cls, value: object) -> object:
+        return ExampleCodec.dump_shared(value)
+
+    @classmethod
+    def _load_shared(cls, shared_memory: object) -> object:
+        # a consumer attaches by name, as another process would
+        return ExampleCodec.load_shared(shared_memory.name)
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--size', type=int, default=16 * 1024 * 1024, help='generated file size in bytes (default: %(default)s)')
+    parser.add_argument('--runs', type=int, default=None, help='runs per measurement, the best is reported (default: 5)')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    BenchCodec.run(size=namespace.size, runs=namespace.runs)
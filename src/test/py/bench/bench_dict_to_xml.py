@@ -0,0 +1,82 @@
+import sys
+import time
+import tracemalloc
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from pathlib import Path
+
+import xmltodict
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+sys.path.insert(0, Path(__file__).parent.parent.parent.parent.joinpath('main', 'py').as_posix())
+
+from exqudens.example import Example
+
+from utils_for_test import UtilsForTest
+
+class BenchDictToXml:
+    """
+    BenchDictToXml class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+
+    @classmethod
+    def run(cls, records: int) -> list[dict[str, object]]:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'dict_to_xml')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            document: dict[str, object] = {'records': {'record': [cls._record(i) for i in range(records)]}}
+            obj: Example = Example()
+
+            def unparse() -> None:
+                with open(out_dir.joinpath('unparse.xml'), 'w', encoding='utf-8') as file:
+                    file.write(xmltodict.unparse(document))
+
+            def unparse_output() -> None:
+                with open(out_dir.joinpath('unparse_output.xml'), 'w', encoding='utf-8') as file:
+                    xmltodict.unparse(document, output=file)
+
+            def dict_to_xml() -> None:
+                with open(out_dir.joinpath('dict_to_xml.xml'), 'wb') as file:
+                    obj.dict_to_xml(document, output=file)
+
+            def records_to_xml() -> None:
+                with open(out_dir.joinpath('records_to_xml.xml'), 'wb') as file:
+                    obj.records_to_xml((cls._record(i) for i in range(records)), item_path='records/record', output=file)
+
+            results: list[dict[str, object]] = []
+            for name, function in [
+                ('unparse', unparse),
+                ('unparse_output', unparse_output),
+                ('dict_to_xml', dict_to_xml),
+                ('records_to_xml', records_to_xml)
+            ]:
+                start: float = time.perf_counter()
+                function()
+                seconds: float = time.perf_counter() - start
+                # tracing slows allocations down, memory is measured in a separate run
+                tracemalloc.start()
+                function()
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                cls.__logger.info(f"mode: {name} records: {records} seconds: {seconds:.3f} peak_kb: {peak // 1024}")
+                results.append({'mode': name, 'records': records, 'seconds': seconds, 'peak_kb': peak // 1024})
+            return results
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _record(cls, i: int) -> dict[str, object]:
+        return {'@id': str(i), 'name': f"name-{i}", 'value': str(i * 7), 'tags': {'tag': ['a', 'b']}}
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--records', type=int, default=200000, help='number of records (default: %(default)s)')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    BenchDictToXml.run(records=namespace.records)
@@ -0,0 +1,116 @@
+import os
+import sys
+import json
+import subprocess
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+
+from utils_for_test import UtilsForTest
+
+class BenchImport:
+    """
+    BenchImport class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __runs: int = 10
+    __budget_ms: float = 100.0
+    __top: int = 15
+    # cold start: package import plus the first conversion of a small document, timed inside the fresh process
+    __code: str = '\n'.join([
+        'import sys',
+        'import time',
+        'start = time.perf_counter()',
+        'from exqudens.example import Example',
+        'imported = time.perf_counter()',
+        "Example().xml_to_dict('<a><b>1</b><b>2</b></a>')",
+        'end = time.perf_counter()',
+        "print((imported - start) * 1000, (end - imported) * 1000, len(sys.modules))"
+    ])
+
+    @classmethod
+    def run(
+        cls,
+        runs: None | int = None,
+        budget_ms: None | float = None,
+        out: None | str = None
+    ) -> int:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'import')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            runs = runs or cls.__runs
+            budget_ms = cls.__budget_ms if budget_ms is None else budget_ms
+            out_file: Path = Path(out) if out else out_dir.joinpath('results.json')
+            env: dict[str, str] = dict(os.environ)
+            env['PYTHONPATH'] = os.pathsep.join([Path(project_dir).joinpath('src', 'main', 'py').as_posix(), env.get('PYTHONPATH', '')])
+
+            # the first run writes the bytecode cache, it is not a cold start in the measured sense
+            cmd: list[str] = [sys.executable, '-c', cls.__code]
+            subprocess.run(cmd, env=env, text=True, check=True, capture_output=True)
+            samples: list[tuple[float, float, int]] = []
+            for _ in range(runs):
+                completed: subprocess.CompletedProcess[str] = subprocess.run(cmd, env=env, text=True, check=True, capture_output=True)
+                import_ms, convert_ms, modules = completed.stdout.split()
+                samples.append((float(import_ms), float(convert_ms), int(modules)))
+            import_ms: float = min(v[0] for v in samples)
+            convert_ms: float = min(v[1] for v in samples)
+            cold_start_ms: float = min(v[0] + v[1] for v in samples)
+
+            completed = subprocess.run([sys.executable, '-X', 'importtime', '-c', cls.__code], env=env, text=True, check=True, capture_output=True)
+            modules: list[dict[str, object]] = cls._parse_importtime(completed.stderr)
+            top: list[dict[str, object]] = sorted(modules, key=lambda v: v['self_us'], reverse=True)[:cls.__top]
+
+            result: dict[str, object] = {
+                'runs': runs,
+                'budget_ms': budget_ms,
+                'import_ms': import_ms,
+                'convert_ms': convert_ms,
+                'cold_start_ms': cold_start_ms,
+                'modules': samples[0][2],
+                'top': top
+            }
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            out_file.write_bytes(json.dumps(result, indent=2).encode())
+            cls.__logger.info(
+                f"import_ms: {import_ms:.1f} convert_ms: {convert_ms:.1f}"
+                f" cold_start_ms: {cold_start_ms:.1f} budget_ms: {budget_ms:.1f} modules: {samples[0][2]}"
+            )
+            for module in top:
+                cls.__logger.info(f"  {module['self_us']:>8} us {module['cumulative_us']:>8} us  {module['name']}")
+            cls.__logger.info(f"results: '{out_file.as_posix()}'")
+
+            if cold_start_ms > budget_ms:
+                cls.__logger.error(f"over budget: cold_start_ms: {cold_start_ms:.1f} budget_ms: {budget_ms:.1f}")
+                return 1
+            return 0
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _parse_importtime(cls, output: str) -> list[dict[str, object]]:
+        # line: 'import time:       self |  cumulative | <indent>name'
+        modules: list[dict[str, object]] = []
+        for line in output.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            values: list[str] = line[len('import time:'):].split('|')
+            if len(values) != 3 or not values[0].strip().isdigit():
+                continue
+            modules.append({'name': values[2].strip(), 'self_us': int(values[0]), 'cumulative_us': int(values[1])})
+        return modules
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--runs', type=int, default=None, help='fresh processes to measure, the best is reported (default: 10)')
+    parser.add_argument('--budget-ms', type=float, default=None, help='cold start budget in milliseconds (default: 100)')
+    parser.add_argument('--out', type=str, default=None, help='results json file (default: build/bench/import/results.json)')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    raise SystemExit(BenchImport.run(runs=namespace.runs, budget_ms=namespace.budget_ms, out=namespace.out))
@@ -0,0 +1,92 @@
+import gc
+import sys
+import json
+import time
+import tracemalloc
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+sys.path.insert(0, Path(__file__).parent.parent.parent.parent.joinpath('main', 'py').as_posix())
+sys.path.insert(0, Path(__file__).parent.as_posix())
+
+from exqudens.example import Example
+from exqudens.example import ExampleBackend
+
+from bench_xml_to_dict import BenchXmlToDict
+from utils_for_test import UtilsForTest
+
+class BenchIntern:
+    """
+    BenchIntern class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __shapes: list[str] = ['deep', 'wide', 'attributes', 'text', 'namespaces']
+
+    @classmethod
+    def run(cls, size: int, backends: None | list[str] = None) -> list[dict[str, object]]:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'intern')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            corpus_dir: Path = Path(project_dir).joinpath('build', 'bench', 'xml_to_dict')
+            corpus_dir.mkdir(parents=True, exist_ok=True)
+
+            results: list[dict[str, object]] = []
+            for shape in cls.__shapes:
+                path: Path = corpus_dir.joinpath(f"{shape}-{size}.xml")
+                if not path.exists():
+                    BenchXmlToDict._generate(path=path, shape=shape, size=size)
+                for backend in backends or ExampleBackend.names():
+                    plain: dict[str, object] = cls._measure(Example(backend=backend), path)
+                    interned: dict[str, object] = cls._measure(Example(backend=backend, interning=True), path)
+                    result: dict[str, object] = {
+                        'shape': shape,
+                        'size': size,
+                        'backend': backend,
+                        'seconds': plain['seconds'],
+                        'interned_seconds': interned['seconds'],
+                        'retained_kb': plain['retained_kb'],
+                        'interned_retained_kb': interned['retained_kb'],
+                        'saved_kb': plain['retained_kb'] - interned['retained_kb']
+                    }
+                    cls.__logger.info(
+                        f"shape: {shape} backend: {backend}"
+                        f" seconds: {result['seconds']:.3f} -> {result['interned_seconds']:.3f}"
+                        f" retained_kb: {result['retained_kb']} -> {result['interned_retained_kb']}"
+                        f" saved: {100 * result['saved_kb'] / max(result['retained_kb'], 1):.0f}%"
+                    )
+                    results.append(result)
+            out_dir.joinpath('results.json').write_bytes(json.dumps(results, indent=2).encode())
+            return results
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _measure(cls, obj: Example, path: Path) -> dict[str, object]:
+        gc.collect()
+        start: float = time.perf_counter()
+        obj.xml_file_to_dict(path)
+        seconds: float = time.perf_counter() - start
+        # retained memory is what the result keeps alive, it is measured in a separate traced run
+        gc.collect()
+        tracemalloc.start()
+        result: dict[str, object] = obj.xml_file_to_dict(path)
+        gc.collect()
+        retained: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del result
+        return {'seconds': seconds, 'retained_kb': retained // 1024}
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--size', type=int, default=16 * 1024 * 1024, help='generated file size in bytes (default: %(default)s)')
+    parser.add_argument('--backends', type=str, nargs='*', default=None, help='parser backends (default: all available)')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
+    BenchIntern.run(size=namespace.size, backends=namespace.backends)
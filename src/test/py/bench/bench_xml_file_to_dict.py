@@ -0,0 +1,99 @@
+import sys
+import json
+import time
+import resource
+import subprocess
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from pathlib import Path
+
+import xmltodict
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+sys.path.insert(0, Path(__file__).parent.parent.parent.parent.joinpath('main', 'py').as_posix())
+
+from exqudens.example import Example
+
+from utils_for_test import UtilsForTest
+
+class BenchXmlFileToDict:
+    """
+    BenchXmlFileToDict class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __modes: list[str] = ['read', 'mmap']
+
+    @classmethod
+    def run(cls, size: int) -> list[dict[str, object]]:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'xml_file_to_dict')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path: Path = out_dir.joinpath(f"records-{size}.xml")
+            if not path.exists():
+                cls._generate(path=path, size=size)
+
+            results: list[dict[str, object]] = []
+            for mode in cls.__modes:
+                cmd: list[str] = [sys.executable, __file__, '--mode', mode, '--path', path.as_posix()]
+                out: subprocess.CompletedProcess[str] = subprocess.run(cmd, text=True, check=True, capture_output=True)
+                result: dict[str, object] = json.loads(out.stdout)
+                cls.__logger.info(f"mode: {mode} size: {size} seconds: {result['seconds']:.3f} max_rss_kb: {result['max_rss_kb']}")
+                results.append(result)
+            return results
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def measure(cls, mode: str, path: str) -> dict[str, object]:
+        try:
+            start: float = time.perf_counter()
+            if mode == 'read':
+                xmltodict.parse(Path(path).read_bytes().decode())
+            elif mode == 'mmap':
+                Example().xml_file_to_dict(path)
+            else:
+                raise Exception(f"unsupported mode: '{mode}'")
+            seconds: float = time.perf_counter() - start
+            return {
+                'mode': mode,
+                'bytes': Path(path).stat().st_size,
+                'seconds': seconds,
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            }
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _generate(cls, path: Path, size: int) -> None:
+        try:
+            with open(path, 'wb') as file:
+                file.write(b'<?xml version="1.0" encoding="utf-8"?>\n<records>')
+                written: int = 0
+                i: int = 0
+                while written < size:
+                    record: bytes = f'<record id="{i}"><name>name-{i}</name><value>{i * 7}</value></record>'.encode()
+                    file.write(record)
+                    written += len(record)
+                    i += 1
+                file.write(b'</records>')
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--size', type=int, default=64 * 1024 * 1024, help='generated file size in bytes (default: %(default)s)')
+    parser.add_argument('--mode', type=str, default=None, help='measure a single mode in this process')
+    parser.add_argument('--path', type=str, default=None, help='file to measure with --mode')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    if namespace.mode:
+        print(json.dumps(BenchXmlFileToDict.measure(mode=namespace.mode, path=namespace.path)))
+    else:
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        BenchXmlFileToDict.run(size=namespace.size)
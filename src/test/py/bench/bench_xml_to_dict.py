@@ -0,0 +1,210 @@
+import sys
+import json
+import time
+import resource
+import subprocess
+import logging
+from logging import LoggerAdapter
+from logging import getLogger as logging_get_logger
+from argparse import ArgumentParser
+from argparse import Namespace
+from pathlib import Path
+
+sys.path.insert(0, Path(__file__).parent.parent.as_posix())
+sys.path.insert(0, Path(__file__).parent.parent.parent.parent.joinpath('main', 'py').as_posix())
+
+from exqudens.example import Example
+from exqudens.example import ExampleBackend
+
+from utils_for_test import UtilsForTest
+
+class BenchXmlToDict:
+    """
+    BenchXmlToDict class.
+    """
+    __logger: LoggerAdapter = logging_get_logger('.'.join([__name__, __qualname__]))
+    __shapes: list[str] = ['deep', 'wide', 'attributes', 'text', 'namespaces']
+    __sizes: list[int] = [1024, 1024 * 1024, 16 * 1024 * 1024]
+    __threshold: float = 0.25
+    __min_seconds: float = 0.5
+
+    @classmethod
+    def run(
+        cls,
+        shapes: None | list[str] = None,
+        sizes: None | list[int] = None,
+        backends: None | list[str] = None,
+        out: None | str = None,
+        baseline: None | str = None,
+        threshold: None | float = None,
+        update_baseline: bool = False
+    ) -> int:
+        try:
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'bench', 'xml_to_dict')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            shapes = shapes or cls.__shapes
+            sizes = sizes or cls.__sizes
+            backends = backends or ExampleBackend.names()
+            out_file: Path = Path(out) if out else out_dir.joinpath('results.json')
+            baseline_file: Path = Path(baseline) if baseline else Path(project_dir).joinpath('build', 'baseline', 'bench', 'xml_to_dict.json')
+            threshold = cls.__threshold if threshold is None else threshold
+            # a missing baseline is an error, a gate that writes its own reference would never fire on a clean checkout
+            if not update_baseline and not baseline_file.exists():
+                raise Exception(f"not exists '{baseline_file.as_posix()}' run with '--update-baseline' to create it")
+
+            cases: list[dict[str, object]] = []
+            for shape in shapes:
+                for size in sizes:
+                    path: Path = out_dir.joinpath(f"{shape}-{size}.xml")
+                    if not path.exists():
+                        cls._generate(path=path, shape=shape, size=size)
+                    for backend in backends:
+                        # every case runs in a fresh process, peak rss is not inherited from the previous one
+                        cmd: list[str] = [sys.executable, __file__, '--measure', path.as_posix(), '--backends', backend]
+                        completed: subprocess.CompletedProcess[str] = subprocess.run(cmd, text=True, check=True, capture_output=True)
+                        case: dict[str, object] = {'shape': shape, 'size': size, **json.loads(completed.stdout)}
+                        cls.__logger.info(
+                            f"shape: {shape} size: {size} backend: {backend}"
+                            f" mb_per_s: {case['mb_per_s']:.1f} records_per_s: {case['records_per_s']:.0f}"
+                            f" max_rss_kb: {case['max_rss_kb']} allocated_blocks: {case['allocated_blocks']}"
+                        )
+                        cases.append(case)
+
+            regressions: list[dict[str, object]] = []
+            if not update_baseline:
+                regressions = cls._compare(
+                    cases=cases,
+                    baseline=json.loads(baseline_file.read_bytes().decode())['cases'],
+                    threshold=threshold
+                )
+            else:
+                baseline_file.parent.mkdir(parents=True, exist_ok=True)
+                baseline_file.write_bytes(json.dumps({'cases': cases}, indent=2).encode())
+                cls.__logger.info(f"baseline: '{baseline_file.as_posix()}'")
+            out_file.parent.mkdir(parents=True, exist_ok=True)
+            out_file.write_bytes(json.dumps({'threshold': threshold, 'cases': cases, 'regressions': regressions}, indent=2).encode())
+            cls.__logger.info(f"results: '{out_file.as_posix()}'")
+
+            for regression in regressions:
+                cls.__logger.error(
+                    f"regression: {regression['shape']}-{regression['size']} {regression['backend']}"
+                    f" mb_per_s: {regression['mb_per_s']:.1f} baseline: {regression['baseline_mb_per_s']:.1f}"
+                )
+            return 1 if regressions else 0
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def measure(cls, path: str, backend: str) -> dict[str, object]:
+        try:
+            size: int = Path(path).stat().st_size
+            obj: Example = Example(backend=backend)
+            blocks: int = sys.getallocatedblocks()
+            result: dict[str, object] = obj.xml_file_to_dict(path)
+            allocated_blocks: int = sys.getallocatedblocks() - blocks
+            records: object = result['records']['record']
+            record_count: int = len(records) if isinstance(records, list) else 1
+            del result
+
+            # small documents are repeated until the timing is stable, the best run is reported
+            seconds: list[float] = []
+            while not seconds or sum(seconds) < cls.__min_seconds:
+                start: float = time.perf_counter()
+                obj.xml_file_to_dict(path)
+                seconds.append(time.perf_counter() - start)
+            best: float = min(seconds)
+            return {
+                'backend': obj.backend.name,
+                'bytes': size,
+                'records': record_count,
+                'runs': len(seconds),
+                'seconds': best,
+                'mb_per_s': size / (1024 * 1024) / best,
+                'records_per_s': record_count / best,
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+                'allocated_blocks': allocated_blocks
+            }
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _compare(
+        cls,
+        cases: list[dict[str, object]],
+        baseline: list[dict[str, object]],
+        threshold: float
+    ) -> list[dict[str, object]]:
+        expected: dict[tuple[object, ...], dict[str, object]] = {(v['shape'], v['size'], v['backend']): v for v in baseline}
+        regressions: list[dict[str, object]] = []
+        for case in cases:
+            previous: None | dict[str, object] = expected.get((case['shape'], case['size'], case['backend']))
+            if previous is None:
+                continue
+            if case['mb_per_s'] < previous['mb_per_s'] * (1 - threshold):
+                regressions.append({**case, 'baseline_mb_per_s': previous['mb_per_s']})
+        return regressions
+
+    @classmethod
+    def _generate(cls, path: Path, shape: str, size: int) -> None:
+        try:
+            if shape not in cls.__shapes:
+                raise Exception(f"unsupported shape: '{shape}' supported: {cls.__shapes}")
+            with open(path, 'wb') as file:
+                if shape == 'namespaces':
+                    file.write(b'<?xml version="1.0" encoding="utf-8"?>\n<records xmlns:a="urn:a" xmlns:b="urn:b">')
+                else:
+                    file.write(b'<?xml version="1.0" encoding="utf-8"?>\n<records>')
+                written: int = 0
+                i: int = 0
+                while written < size:
+                    record: bytes = cls._record(shape=shape, i=i)
+                    file.write(record)
+                    written += len(record)
+                    i += 1
+                file.write(b'</records>')
+        except Exception as e:
+            cls.__logger.error(e, exc_info=True)
+            raise e
+
+    @classmethod
+    def _record(cls, shape: str, i: int) -> bytes:
+        if shape == 'deep':
+            return (f'<record id="{i}">' + '<n>' * 32 + f'<v>{i}</v>' + '</n>' * 32 + '</record>').encode()
+        if shape == 'wide':
+            return (f'<record id="{i}">' + ''.join(f'<f{j}>{i + j}</f{j}>' for j in range(50)) + '</record>').encode()
+        if shape == 'attributes':
+            return ('<record' + ''.join(f' a{j}="{i * j}"' for j in range(20)) + '/>').encode()
+        if shape == 'text':
+            return f'<record id="{i}"><body>{"lorem &amp; ipsum &lt;dolor&gt; sit amet " * 24}{i}</body></record>'.encode()
+        return (
+            f'<record a:id="{i}"><a:name>name-{i}</a:name><b:value b:unit="ms">{i * 7}</b:value>'
+            f'<c xmlns="urn:c"><d>{i}</d></c></record>'
+        ).encode()
+
+if __name__ == '__main__':
+    parser: ArgumentParser = ArgumentParser()
+    parser.add_argument('--shapes', type=str, nargs='*', default=None, help='document shapes (default: all)')
+    parser.add_argument('--sizes', type=int, nargs='*', default=None, help='generated file sizes in bytes, up to 1 GB (default: 1 KB 1 MB 16 MB)')
+    parser.add_argument('--backends', type=str, nargs='*', default=None, help='parser backends (default: all available)')
+    parser.add_argument('--out', type=str, default=None, help='results json file (default: build/bench/xml_to_dict/results.json)')
+    parser.add_argument('--baseline', type=str, default=None, help='baseline json file (default: build/baseline/bench/xml_to_dict.json)')
+    parser.add_argument('--update-baseline', action='store_true', help='write the results to the baseline instead of comparing with it')
+    parser.add_argument('--threshold', type=float, default=None, help='allowed relative throughput drop (default: 0.25)')
+    parser.add_argument('--measure', type=str, default=None, help='measure a single file in this process')
+    namespace: Namespace = parser.parse_args(sys.argv[1:])
+    if namespace.measure:
+        print(json.dumps(BenchXmlToDict.measure(path=namespace.measure, backend=namespace.backends[0])))
+    else:
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        raise SystemExit(BenchXmlToDict.run(
+            shapes=namespace.shapes,
+            sizes=namespace.sizes,
+            backends=namespace.backends,
+            out=namespace.out,
+            baseline=namespace.baseline,
+            threshold=namespace.threshold,
+            update_baseline=namespace.update_baseline
+        ))
@@ -1,7 +1,36 @@
+import io
+import os
+import sys
+import json
+import math
+import subprocess
+import asyncio
 from logging import LoggerAdapter
 from logging import getLogger as logging_get_logger
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from datetime import date
+from datetime import datetime
+from xml.parsers.expat import ExpatError
+
+import xmltodict
 
 from exqudens.example import Example
+from exqudens.example import ExampleBackend
+from exqudens.example import ExampleCache
+from exqudens.example import ExampleClient
+from exqudens.example import ExampleCodec
+from exqudens.example import ExampleColumns
+from exqudens.example import ExampleInstrumentation
+from exqudens.example import ExampleInternPool
+from exqudens.example import ExampleLazyDict
+from exqudens.example import ExampleNode
+from exqudens.example import ExampleSchema
+from exqudens.example import ExampleSelector
+from exqudens.example import ExampleServer
+from exqudens.example import ExampleStats
 
 from utils_for_test import UtilsForTest
 
@@ -25,3 +54,691 @@ class TestUnitAll:
         except Exception as e:
             self.__logger.info(e, exc_info=True)
             raise e
+
+    def test_2(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: str = '<a><b id="1"><c>x</c></b><b id="2">y</b><b>z</b><d/></a>'
+            obj: Example = Example()
+            expected: list[object] = obj.xml_to_dict(xml)['a']['b']
+            self.__logger.info(f"expected: {expected}")
+
+            actual: list[object] = list(obj.iter_xml_to_dict(xml, item_path='a/b', chunk_size=3))
+            self.__logger.info(f"actual: {actual}")
+
+            assert actual == expected
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_3(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_3')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            paths: list[str] = []
+            for i in range(4):
+                path: Path = out_dir.joinpath(f"{i}.xml")
+                path.write_bytes(f'<a><b>{i}</b></a>'.encode())
+                paths.append(path.as_posix())
+            broken: Path = out_dir.joinpath('broken.xml')
+            broken.write_bytes(b'<a><b></a>')
+            paths.insert(2, broken.as_posix())
+
+            obj: Example = Example()
+            results: list[tuple[str, object, object]] = obj.xml_to_dict_many(paths, workers=2)
+            self.__logger.info(f"results: {results}")
+
+            assert [path for path, _, _ in results] == paths
+            assert results[2][1] is None and isinstance(results[2][2], ExpatError)
+            assert [result for _, result, error in results if error is None] == [{'a': {'b': str(i)}} for i in range(4)]
+
+            unordered: list[tuple[str, object, object]] = obj.xml_to_dict_many(paths, workers=2, ordered=False)
+            assert sorted(path for path, _, _ in unordered) == sorted(paths)
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_4(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_4')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            records: str = ''.join(f'<b id="{i}"><bb>{i}</bb></b>' for i in range(20))
+            xml: str = f'<?xml version="1.0"?>\n<a x="1"><h>head</h>{records}<t>tail</t></a>'
+            path: Path = out_dir.joinpath('a.xml')
+            path.write_bytes(xml.encode())
+
+            obj: Example = Example()
+            expected: dict[str, object] = obj.xml_to_dict(xml)
+            for split_size in [1, 64, 1024 * 1024]:
+                actual: dict[str, object] = obj.xml_file_to_dict_parallel(path.as_posix(), item_path='a/b', workers=2, split_size=split_size)
+                self.__logger.info(f"split_size: {split_size}")
+                assert actual == expected
+
+            for xml in ['<a>x<b>1</b>y<b>2</b>z</a>', '<!-- <a> --><a k="v"><b>1</b>t<b>2</b></a>',
+                        '<a><x><b>1</b></x><b>2</b></a>', '<a><!-- <b> --><b>1</b><![CDATA[<b>]]></a>']:
+                path.write_bytes(xml.encode())
+                actual = obj.xml_file_to_dict_parallel(path.as_posix(), item_path='a/b', workers=2, split_size=1)
+                assert actual == xmltodict.parse(xml), xml
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_5(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_5')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            xml: str = '<a>' + ''.join(f'<b id="{i}">ü{i}</b>' for i in range(100)) + '</a>'
+            path: Path = out_dir.joinpath('a.xml')
+            path.write_bytes(xml.encode())
+
+            obj: Example = Example()
+            expected: dict[str, object] = obj.xml_to_dict(xml)
+            actual: dict[str, object] = obj.xml_file_to_dict(path.as_posix(), chunk_size=7)
+            self.__logger.info(f"actual: {actual}")
+
+            assert actual == expected
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_6(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_6')
+            cache_dir: Path = out_dir.joinpath('cache')
+            ExampleCache(dir=cache_dir.as_posix()).clear()
+            xml: str = '<a><b>1</b><b>2</b></a>'
+
+            cache: ExampleCache = ExampleCache(dir=cache_dir.as_posix())
+            obj: Example = Example(cache=cache)
+            first: dict[str, object] = obj.xml_to_dict(xml)
+            first['a']['b'].append('3')
+            second: dict[str, object] = obj.xml_to_dict(xml)
+            self.__logger.info(f"stats: {cache.stats()}")
+
+            assert second == {'a': {'b': ['1', '2']}}
+            assert cache.stats()['hits'] == 1 and cache.stats()['misses'] == 1
+
+            other_cache: ExampleCache = ExampleCache(dir=cache_dir.as_posix())
+            path: Path = out_dir.joinpath('a.xml')
+            path.write_bytes(xml.encode())
+            third: dict[str, object] = Example(cache=other_cache).xml_file_to_dict(path.as_posix())
+            self.__logger.info(f"stats: {other_cache.stats()}")
+
+            assert third == second
+            assert other_cache.stats()['disk_hits'] == 1 and other_cache.stats()['misses'] == 0
+
+            # 'str' input is parsed as utf-8, 'bytes' input follows its declaration
+            latin: str = '<?xml version="1.0" encoding="latin-1"?><a>é</a>'
+            obj = Example(cache=ExampleCache())
+
+            assert obj.xml_to_dict(latin) == {'a': 'é'}
+            assert obj.xml_to_dict(latin.encode()) == Example().xml_to_dict(latin.encode()) == {'a': 'Ã©'}
+            assert ExampleSchema(types={'a': int}).key == ExampleSchema(types={'a': int}).key is not None
+            assert ExampleSchema(types={'a': lambda v: v}).key is None
+
+            # converters without a stable name bypass the cache instead of sharing one key
+            cache = ExampleCache()
+
+            assert Example(cache=cache, schema=ExampleSchema(types={'a': lambda v: int(v)})).xml_to_dict('<a>5</a>') == {'a': 5}
+            assert Example(cache=cache, schema=ExampleSchema(types={'a': lambda v: v + '!'})).xml_to_dict('<a>5</a>') == {'a': '5!'}
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_7(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: str = '<a k="v"> t1 <b id="1"><c>x</c></b> t2<b id="2">y</b><b> z </b><d/><f><g/></f></a>'
+            obj: Example = Example()
+            node: ExampleNode = obj.xml_to_node(xml, chunk_size=5)
+            self.__logger.info(f"node: {node.to_dict()}")
+
+            assert node.to_dict() == obj.xml_to_dict(xml)
+            assert node.tag == 'a' and node.attributes == (('k', 'v'),) and node.text == 't1  t2'
+            assert [child.tag for child in node.children] == ['b', 'b', 'b', 'd', 'f']
+            assert node.children[1].text == 'y' and node.children[3].text is None
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_8(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            obj: Example = Example()
+            for xml in [
+                '<?xml version="1.0"?><a k="v"> t1 <b id="1"><c>x &amp; y</c></b> t2<b>y</b><bb><b/></bb><d/><e i="&gt;"/></a>',
+                '<a><!-- comment --><b><c>1</c><c>2</c></b></a>',
+                '<a><b><b><b/>1</b><b>2</b></b></a>'
+            ]:
+                expected: dict[str, object] = obj.xml_to_dict(xml)
+                actual: ExampleLazyDict = obj.xml_to_lazy_dict(xml)
+                self.__logger.info(f"actual: {actual}")
+
+                assert isinstance(actual['a'], ExampleLazyDict)
+                assert actual == expected
+                assert actual.to_dict() == expected
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_9(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: str = '<o id="9" k="z"><c><id>1</id><n>n</n></c><is><i><s>a</s><q>1</q></i><i><s a="1">b<z>1</z></s></i><i/></is></o>'
+            obj: Example = Example()
+            selector: ExampleSelector = ExampleSelector(['o/c/id', 'o/is/i/s', 'o/@id'])
+            actual: dict[str, object] = obj.xml_to_dict_selected(xml, selector, chunk_size=4)
+            self.__logger.info(f"actual: {actual}")
+
+            assert actual == {'o': {'@id': '9', 'c': {'id': '1'}, 'is': {'i': [{'s': 'a'}, {'s': {'@a': '1', 'z': '1', '#text': 'b'}}, None]}}}
+            assert obj.xml_to_dict_selected(xml, ['o']) == obj.xml_to_dict(xml)
+            assert obj.xml_to_dict_selected(xml, ['x/y']) == {}
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_10(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: bytes = b'<a><b id="1"><c>x</c></b><b id="2">y</b><b>z</b></a>'
+            obj: Example = Example(max_concurrency=2)
+            expected: dict[str, object] = obj.xml_to_dict(xml)
+
+            async def produce(reader: asyncio.StreamReader) -> None:
+                for i in range(0, len(xml), 5):
+                    reader.feed_data(xml[i:i + 5])
+                    await asyncio.sleep(0)
+                reader.feed_eof()
+
+            async def chunks() -> object:
+                for i in range(0, len(xml), 7):
+                    yield xml[i:i + 7]
+
+            async def run() -> tuple[object, ...]:
+                reader: asyncio.StreamReader = asyncio.StreamReader()
+                producer: asyncio.Task = asyncio.create_task(produce(reader))
+                items: list[object] = [v async for v in obj.aiter_xml_to_dict(reader, item_path='a/b', chunk_size=3)]
+                await producer
+                results: list[dict[str, object]] = await asyncio.gather(*[obj.axml_to_dict(xml) for _ in range(5)])
+                streamed: dict[str, object] = await obj.axml_to_dict(chunks())
+                return items, results, streamed
+
+            items, results, streamed = asyncio.run(run())
+            self.__logger.info(f"items: {items}")
+
+            assert items == expected['a']['b']
+            assert results == [expected] * 5
+            assert streamed == expected
+
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                assert asyncio.run(Example(executor=executor).axml_to_dict(xml)) == expected
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                try:
+                    Example(executor=executor)
+                    raise AssertionError("'ProcessPoolExecutor' accepted")
+                except Exception as e:
+                    assert str(e) == "'executor' is not an instance of 'ThreadPoolExecutor'"
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_11(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            document: dict[str, object] = {'a': {'@x': '1"2', '@y': 'a\nb<', '@z': True, 'b': [1, None, True, {'@k': 'v', '#text': 't&', 'c': 'd'}], 'e': {}, '#text': 'tail'}}
+            obj: Example = Example()
+            expected: str = xmltodict.unparse(document)
+            actual: str = obj.dict_to_xml(document)
+            self.__logger.info(f"actual: {actual}")
+
+            assert actual == expected
+
+            document = {'a': {'@x': 'é', 'b': ['ü', False]}}
+            expected_output: io.BytesIO = io.BytesIO()
+            xmltodict.unparse(document, output=expected_output, encoding='ascii')
+            output: io.BytesIO = io.BytesIO()
+            obj.dict_to_xml(document, output=output, encoding='ascii')
+
+            assert output.getvalue() == expected_output.getvalue()
+
+            output = io.BytesIO()
+            records: object = ({'@id': str(i), 'v': str(i)} for i in range(100))
+            obj.records_to_xml(records, item_path='a/b', output=output, buffer_size=16)
+
+            assert obj.xml_to_dict(output.getvalue()) == {'a': {'b': [{'@id': str(i), 'v': str(i)} for i in range(100)]}}
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_12(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            documents: list[bytes] = [
+                b'<a/>',
+                b'<a> </a>',
+                b'<a x="1">t</a>',
+                b'<a><b>1</b><b>2</b><c x="y">z</c><d/></a>',
+                b'<a>x<b>1</b>y<!--c-->z<?p d?>w<![CDATA[<q>]]></a>',
+                b'<?xml version="1.0"?><!DOCTYPE a><a xml:lang="en">&amp;&lt;</a>',
+                b'<a xmlns="u" xmlns:p="v" x="1"><p:b p:c="2">t</p:b><b/><d xmlns:q="w"><q:e/></d></a>',
+                b'<a>' + b''.join(b'<b id="%d"><c>%d</c></b>' % (i, i) for i in range(100)) + b'<d xmlns:k="v"><k:e k:f="1"/></d></a>',
+                '<a><é x="ü">ö</é></a>'.encode(),
+                b'<a><![CDATA[<!ENTITY x>]]></a>',
+                b'<a><!-- <!ENTITY --></a>',
+                b'<a xmlns:x="u" xmlns:y="u"><x:b/><y:c/></a>',
+                b'<a xmlns="u" xmlns:p="u"><p:b>1</p:b><b>2</b></a>',
+                b'<a k="1" xmlns:x="u"><x:b/></a>'
+            ]
+            names: list[str] = ExampleBackend.names()
+            self.__logger.info(f"names: {names}")
+
+            assert names[-1] == 'xmltodict'
+            assert Example().backend.name == names[0]
+
+            for name in names:
+                backend: ExampleBackend = ExampleBackend.create(name)
+                for document in documents:
+                    for chunk_size in [5, 1024]:
+                        chunks: list[bytes] = [document[i:i + chunk_size] for i in range(0, len(document), chunk_size)]
+
+                        assert json.dumps(backend.parse(chunks)) == json.dumps(xmltodict.parse(document)), f"{name}: {document!r}"
+                        assert json.dumps(backend.parse(iter(chunks))) == json.dumps(xmltodict.parse(document)), f"{name}: {document!r}"
+
+                for document in [b'<a><b></a>', b'<!DOCTYPE a [<!ENTITY e "x">]><a>&e;</a>']:
+                    try:
+                        backend.parse([document])
+                        raise AssertionError(f"{name}: {document!r}")
+                    except (ValueError, ExpatError) as e:
+                        self.__logger.info(f"{name}: {e}")
+
+                assert Example(backend=name).xml_to_dict(documents[3].decode()) == xmltodict.parse(documents[3])
+                assert Example(backend=name).xml_to_dict(b'<a><![CDATA[<!ENTITY x>]]></a>') == {'a': '<!ENTITY x>'}
+                assert Example(backend=name).xml_to_dict(b'<a><!-- <!ENTITY --></a>') == {'a': None}
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_13(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            tmp_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_13')
+            tmp_dir.mkdir(parents=True, exist_ok=True)
+            path: Path = tmp_dir.joinpath('a.xml')
+            document: bytes = b'<a><b x="1"><c>1</c><c>2</c></b><d/></a>'
+            path.write_bytes(document)
+
+            calls: list[ExampleStats] = []
+            instrumentation: ExampleInstrumentation = ExampleInstrumentation(
+                callback=calls.append,
+                profile=True,
+                trace_memory=True,
+                dir=tmp_dir.joinpath('profile')
+            )
+            obj: Example = Example(instrumentation=instrumentation)
+
+            assert obj.xml_to_dict(document) == xmltodict.parse(document)
+            assert obj.xml_file_to_dict(path) == xmltodict.parse(document)
+            assert [v.method for v in calls] == ['xml_to_dict', 'xml_file_to_dict']
+
+            for stats in calls:
+                self.__logger.info(f"stats: {stats.to_dict()}")
+
+                assert stats.bytes_in == len(document)
+                assert stats.elements == 5
+                assert stats.max_depth == 3
+                assert 'parse' in stats.phases
+                assert stats.seconds >= sum(stats.phases.values())
+                assert stats.peak_kb is not None
+                assert Path(stats.profile_file).exists()
+                assert Path(stats.trace_file).exists()
+
+            assert instrumentation.last is calls[-1]
+            assert instrumentation.stats() == {
+                'calls': 2,
+                'seconds': calls[0].seconds + calls[1].seconds,
+                'bytes_in': 2 * len(document),
+                'elements': 10,
+                'max_depth': 3
+            }
+            assert Example().instrumentation is None
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_14(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: bytes = b'<o id="7" ok="true"><t>2024-01-02T03:04:05</t><d>2024-01-02</d><i n="1"><p>1.5</p></i><v u="m">12</v><e/><x><y>1</y></x></o>'
+            schema: ExampleSchema = ExampleSchema(
+                types={'o/@id': int, 'o/@ok': bool, 'o/t': datetime, 'o/d': 'date', 'o/i/@n': 'int', 'o/i/p': float, 'o/v': int, 'o/e': int, 'o/x/y': int},
+                lists=['o/i', 'o/x/y']
+            )
+            expected: dict[str, object] = {'o': {
+                '@id': 7,
+                '@ok': True,
+                't': datetime(2024, 1, 2, 3, 4, 5),
+                'd': date(2024, 1, 2),
+                'i': [{'@n': 1, 'p': 1.5}],
+                'v': {'@u': 'm', '#text': 12},
+                'e': None,
+                'x': {'y': [1]}
+            }}
+
+            for name in ExampleBackend.names():
+                obj: Example = Example(backend=name, schema=schema)
+                actual: dict[str, object] = obj.xml_to_dict(xml)
+                self.__logger.info(f"{name}: {actual}")
+
+                assert actual == expected
+
+            cache: ExampleCache = ExampleCache()
+            assert Example(cache=cache, schema=schema).xml_to_dict(xml) == expected
+            assert Example(cache=cache).xml_to_dict(xml) == xmltodict.parse(xml)
+
+            try:
+                Example(schema=ExampleSchema(types={'o/v': bool})).xml_to_dict(xml)
+                raise AssertionError("converted")
+            except ValueError as e:
+                self.__logger.info(f"error: {e}")
+
+                assert str(e).startswith("'o/v' value '12'")
+
+            # streamed and item paths apply the schema the same way
+            document: bytes = b'<a><b k="3">1</b><b>2</b><c><b>x</b></c></a>'
+            obj = Example(schema=ExampleSchema(types={'a/b': int, 'a/b/@k': int}, lists=['a/c']))
+
+            async def chunks() -> object:
+                for i in range(0, len(document), 4):
+                    yield document[i:i + 4]
+
+            async def run() -> tuple[object, ...]:
+                return await obj.axml_to_dict(chunks()), [v async for v in obj.aiter_xml_to_dict(chunks(), 'a/b')]
+
+            streamed, items = asyncio.run(run())
+            path: Path = Path(UtilsForTest.get_project_dir()).joinpath('build', 'test', 'out', 'tmp', 'test_14', 'a.xml')
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(document)
+            Path(path.as_posix() + '.state').unlink(missing_ok=True)
+
+            assert streamed == obj.xml_to_dict(document) == {'a': {'b': [{'@k': 3, '#text': 1}, 2], 'c': [{'b': 'x'}]}}
+            assert items == list(obj.iter_xml_to_dict(document, 'a/b')) == list(obj.iter_xml_file_incremental(path, 'a/b')) == [{'@k': 3, '#text': 1}, 2]
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_15(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: bytes = b'<a>' + b''.join(b'<b k="open"><c>x%d</c><s>done</s></b>' % (i % 3) for i in range(10)) + b'</a>'
+            expected: dict[str, object] = xmltodict.parse(xml)
+
+            for name in ExampleBackend.names():
+                actual: dict[str, object] = Example(backend=name, interning=True).xml_to_dict(xml)
+
+                assert actual == expected
+                assert len({id(v['s']) for v in actual['a']['b']}) == 1
+                assert len({id(v['@k']) for v in actual['a']['b']}) == 1
+
+                pool: ExampleInternPool = ExampleInternPool(max_length=3)
+                obj: Example = Example(backend=name, interning=pool)
+                first: dict[str, object] = obj.xml_to_dict(xml)
+                second: dict[str, object] = obj.xml_to_dict(xml)
+                self.__logger.info(f"{name}: {pool.stats()}")
+
+                assert first == second == expected
+                assert obj.pool is pool
+                assert pool.stats()['entries'] == 8
+                assert first['a']['b'][0]['c'] is second['a']['b'][0]['c']
+                assert first['a']['b'][0]['s'] is not second['a']['b'][0]['s']
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_16(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_16')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path: Path = out_dir.joinpath('log.xml')
+            state_file: Path = out_dir.joinpath('log.xml.state')
+            state_file.unlink(missing_ok=True)
+            path.write_bytes(b'<?xml version="1.0" encoding="utf-8"?>\n<log x:v="1" xmlns:x="urn:x"><group n="a&gt;b"><e i="0">zero</e><e i="1"/>')
+
+            obj: Example = Example()
+            first: list[object] = list(obj.iter_xml_file_incremental(path, 'log/group/e', chunk_size=7))
+            self.__logger.info(f"first: {first}")
+
+            assert first == [{'@i': '0', '#text': 'zero'}, {'@i': '1'}]
+            assert state_file.exists()
+            assert list(obj.iter_xml_file_incremental(path, 'log/group/e', chunk_size=7)) == []
+
+            with open(path, 'ab') as file:
+                file.write(b'<e i="2" t=">">two</e><e i=')
+            assert list(obj.iter_xml_file_incremental(path, 'log/group/e')) == [{'@i': '2', '@t': '>', '#text': 'two'}]
+
+            with open(path, 'ab') as file:
+                file.write(b'"3"><x:c>3</x:c></e></group><group><e i="4"/></group></log>')
+            assert list(obj.iter_xml_file_incremental(path, 'log/group/e', chunk_size=5)) == [{'@i': '3', 'x:c': '3'}, {'@i': '4'}]
+
+            path.write_bytes(b'<log><group><e i="9"/></group></log>')
+            assert list(obj.iter_xml_file_incremental(path, 'log/group/e')) == [{'@i': '9'}]
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_17(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: bytes = (
+                b'<a><h>skip</h>'
+                b'<r id="1" ok="true"><p>1.5</p><n>x<q>nested</q></n></r>'
+                b'<r id="2" ok="0"><p/><n>y</n>tail</r>'
+                b'<r id="3" ok="1"><p>-2</p><p>9</p><g><n>deep</n></g></r>'
+                b'</a>'
+            )
+            fields: list[str] = ['@id', '@ok', 'p', 'n', 'g/n', '#text', 'n/q']
+            types: dict[str, object] = {'@id': int, '@ok': 'bool', 'p': 'float'}
+
+            obj: Example = Example()
+            columns: dict[str, object] = obj.xml_to_columns(xml, 'a/r', fields, types=types, numpy=False, chunk_size=5)
+            self.__logger.info(f"columns: {columns}")
+
+            assert list(columns) == fields
+            assert columns['@id'] == array('q', [1, 2, 3])
+            assert columns['@ok'] == array('b', [1, 0, 1])
+            assert columns['p'][0] == 1.5 and math.isnan(columns['p'][1]) and columns['p'][2] == -2.0
+            assert columns['n'] == ['x', 'y', None]
+            assert columns['g/n'] == [None, None, 'deep']
+            assert columns['#text'] == [None, 'tail', None]
+            assert columns['n/q'] == ['nested', None, None]
+
+            if ExampleColumns.available():
+                arrays: dict[str, object] = obj.xml_to_columns(xml, 'a/r', fields, types=types)
+                assert str(arrays['@id'].dtype) == 'int64' and arrays['@id'].tolist() == [1, 2, 3]
+                assert str(arrays['@ok'].dtype) == 'bool' and arrays['@ok'].tolist() == [True, False, True]
+                assert arrays['n'].tolist() == ['x', 'y', None]
+
+            try:
+                obj.xml_to_columns(b'<a><r/></a>', 'a/r', ['@id'], types={'@id': 'int'}, numpy=False)
+                raise AssertionError("missing 'int' value is not rejected")
+            except ValueError as e:
+                self.__logger.info(f"error: {e}")
+
+                assert str(e) == "'@id' value is missing in row 0"
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_18(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            env: dict[str, str] = dict(os.environ)
+            env['PYTHONPATH'] = Path(project_dir).joinpath('src', 'main', 'py').as_posix()
+            code: str = '\n'.join([
+                'import sys',
+                'import exqudens.example',
+                "print(' '.join(sorted(v for v in sys.modules if v.startswith('exqudens.example.'))))",
+                'from exqudens.example import Example',
+                "assert Example().xml_to_dict('<a><b>1</b></a>') == {'a': {'b': '1'}}",
+                "print(' '.join(sorted(v for v in ['xmltodict', 'asyncio', 'concurrent.futures', 'xml.sax.saxutils', 'json', 'pickle'] if v in sys.modules)))"
+            ])
+            completed: subprocess.CompletedProcess[str] = subprocess.run([sys.executable, '-c', code], env=env, text=True, check=True, capture_output=True)
+            package_modules, loaded = completed.stdout.split('\n')[:2]
+            self.__logger.info(f"package_modules: '{package_modules}' loaded: '{loaded}'")
+
+            assert package_modules == ''
+            assert loaded == ''
+
+            import exqudens.example
+            assert 'ExampleSchema' in dir(exqudens.example)
+            assert exqudens.example.ExampleSchema is ExampleSchema
+            try:
+                exqudens.example.ExampleMissing
+                raise AssertionError("missing attribute is not rejected")
+            except AttributeError as e:
+                self.__logger.info(f"error: {e}")
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_19(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            project_dir: str = UtilsForTest.get_project_dir()
+            out_dir: Path = Path(project_dir).joinpath('build', 'test', 'out', 'tmp', 'test_19')
+            out_dir.mkdir(parents=True, exist_ok=True)
+            path: Path = out_dir.joinpath('a.xml')
+            path.write_bytes(b'<a><b>1</b><b>2</b></a>')
+            socket_path: str = out_dir.joinpath('server.sock').as_posix()
+
+            with ExampleServer(socket_path, workers=2, max_jobs=3) as server, ExampleClient(socket_path, timeout=30) as client:
+                for i in range(4):
+                    assert client.xml_to_dict(f'<a><b>{i}</b></a>') == {'a': {'b': str(i)}}
+                assert client.xml_file_to_dict(path) == {'a': {'b': ['1', '2']}}
+                try:
+                    client.xml_to_dict(b'<a><b></a>')
+                    raise AssertionError("malformed input is not rejected")
+                except ExpatError as e:
+                    self.__logger.info(f"error: {e}")
+                try:
+                    client.xml_file_to_dict(out_dir.joinpath('missing.xml'))
+                    raise AssertionError("missing file is not rejected")
+                except FileNotFoundError as e:
+                    self.__logger.info(f"error: {e}")
+
+                stats: dict[str, int] = client.stats()
+                self.__logger.info(f"stats: {stats}")
+
+                assert stats == server.stats()
+                assert stats['jobs'] == 7
+                assert stats['recycled'] >= 1
+                assert stats['failures'] == 0
+
+            with ExampleServer(socket_path, workers=1, max_rss_kb=1) as server, ExampleClient(socket_path) as client:
+                assert client.xml_to_dict('<a/>') == {'a': None}
+                assert client.xml_to_dict('<a/>') == {'a': None}
+                assert server.stats()['recycled'] == 2
+
+            assert not Path(socket_path).exists()
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e
+
+    def test_20(self) -> None:
+        try:
+            self.__logger.info("bgn")
+
+            xml: bytes = b'<a x="1"><b>1</b><b>2</b><c/><d e="\xc3\xa9">t</d></a>'
+            value: dict[str, object] = Example().xml_to_dict(xml)
+            data: bytes = ExampleCodec.encode(value)
+            self.__logger.info(f"data: {len(data)} bytes")
+
+            assert ExampleCodec.decode(data) == value
+            assert ExampleCodec.decode(memoryview(bytearray(data))) == value
+
+            typed: dict[str, object] = {'a': {'n': 1, 'f': 1.5, 'ok': True, 'at': datetime(2024, 1, 2, 3, 4), 'on': date(2024, 1, 2), 'big': 1 << 80}}
+            assert ExampleCodec.decode(ExampleCodec.encode(typed)) == typed
+
+            shared_memory: object = ExampleCodec.dump_shared(value)
+            try:
+                assert ExampleCodec.load_shared(shared_memory.name) == value
+                assert ExampleCodec.load_shared(shared_memory) == value
+            finally:
+                shared_memory.close()
+                shared_memory.unlink()
+
+            try:
+                ExampleCodec.decode(b'\x80\x05 not encoded')
+                raise AssertionError("foreign data is not rejected")
+            except ValueError as e:
+                self.__logger.info(f"error: {e}")
+
+            self.__logger.info("end")
+        except Exception as e:
+            self.__logger.info(e, exc_info=True)
+            raise e